@@ -5,16 +5,37 @@ import json
 import time
 import queue
 import threading
+import shutil
 import tempfile
+import codecs
+import uuid
 import atexit
+import traceback
 import subprocess
+import concurrent.futures
 import webbrowser
+from collections import OrderedDict
 import pyperclip
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urlparse, parse_qs
 
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, TclError
+
+# Optional: orjson parses/serializes several times faster; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Cross-process file locks (see _acquire_file_lock)
+if sys.platform.startswith("win"):
+    import msvcrt
+    fcntl = None
+else:
+    import fcntl
+    msvcrt = None
 
 # Set Windows AppUserModelID early so the taskbar and "open apps" panel
 # show Clipster's icon instead of Python's.
@@ -45,6 +66,7 @@ SPLASH_TEXT = "Fetch. Download. Enjoy."
 GITHUB_REPO = "nisarg27998/Clipster"
 GITHUB_API_LATEST = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
 GITHUB_RELEASES_URL = f"https://github.com/{GITHUB_REPO}/releases"
+STARTUP_UPDATE_CHECK_DELAY_MS = 3000
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -52,8 +74,10 @@ ASSETS_DIR = BASE_DIR / "Assets"
 APP_ICON_PATH = ASSETS_DIR / "app_icon.ico"
 WINDOWS_DOWNLOADS_DIR = str(Path.home() / "Downloads")
 DOWNLOADS_DIR = BASE_DIR / "downloads"
+_DOWNLOADS_DIR_STR = str(DOWNLOADS_DIR)
 TEMP_DIR = BASE_DIR / "temp"
-HISTORY_FILE = BASE_DIR / "history.json"
+HISTORY_FILE = BASE_DIR / "history.ndjson"
+LEGACY_HISTORY_FILE = BASE_DIR / "history.json"   # older single JSON list, migrated on startup
 SETTINGS_FILE = BASE_DIR / "settings.json"
 
 YT_DLP_EXE = ASSETS_DIR / "yt-dlp.exe"
@@ -64,11 +88,32 @@ FFPROBE_EXE = ASSETS_DIR / "ffprobe.exe"
 ALLOWED_FORMATS = ["mp4", "mkv", "webm", "m4a", "mp3"]
 
 YOUTUBE_URL_RE = re.compile(r"(https?://)?(www\.)?(youtube\.com|youtu\.be)/.+", re.IGNORECASE)
+_VID_RE = re.compile(r"(?:[?&]v=|/vi?/|youtu\.be/|/embed/|/shorts/)([A-Za-z0-9_-]{11})")
+# Host prefixes checked with str.startswith before falling back to the regex
+_URL_SCHEMES = ("http://", "https://")
+_YOUTUBE_HOSTS = (
+    "youtube.com/", "www.youtube.com/", "m.youtube.com/", "music.youtube.com/",
+    "youtu.be/", "www.youtu.be/",
+)
 YOUTUBE_PLAYLIST_RE = re.compile(r"(youtube\.com|youtu\.be).*[?&]list=", re.IGNORECASE)
 #YOUTUBE_PLAYLIST_RE = re.compile(r"(https?://)?(www\.)?youtube\.com/.*[?&]list=", re.IGNORECASE)
-YT_DLP_PROGRESS_RE = re.compile(r"\[download\]\s+([\d\.]+)%")
-YT_DLP_SPEED_RE = re.compile(r"at\s+([0-9\.]+\w+/s)")
-YT_DLP_ETA_RE = re.compile(r"ETA\s+([0-9:]+)")
+# yt-dlp lines that announce where the (final) file is written
+_YT_DLP_DEST_PREFIXES = (
+    "[download] Destination:",
+    "[Merger] Merging formats into",
+    "[ExtractAudio] Destination:",
+)
+_YT_DLP_ALREADY_SUFFIX = " has already been downloaded"
+# Minimum seconds between progress callbacks from a running download (~30 Hz)
+PROGRESS_EMIT_INTERVAL = 1 / 30
+# yt-dlp output that means the video needs a signed-in account
+_AUTH_ERRS = ("Sign in to confirm your age", "This video is only available for members", "This video is private")
+# One pass per progress line: "[download]  42.0% of 10.00MiB at 1.20MiB/s ETA 00:05"
+YT_DLP_LINE_RE = re.compile(
+    r"\[download\]\s+(?P<pct>[\d.]+)%"
+    r"(?:.*?\bat\s+(?P<speed>[\d.]+\w+/s))?"
+    r"(?:.*?ETA\s+(?P<eta>[\d:]+))?"
+)
 
 LOG_FILE = BASE_DIR / "clipster.log"
 
@@ -87,21 +132,89 @@ def get_pil_image():
     return Image
 
 
+# Safety-net poll interval for ui_queue; normal delivery is event-driven
+UI_QUEUE_FALLBACK_MS = 1000
+# Playlist rows built / events handled per drain before yielding to Tk for a repaint
+UI_ROWS_PER_DRAIN = 25
+UI_MAX_EVENTS_PER_DRAIN = 64
+# UI events keyed by (name, item id) where only the newest one per drain matters
+_COALESCED_UI_EVENTS = frozenset({"dl_item_progress", "playlist_row_progress"})
+
+
+class _NotifyingQueue(queue.Queue):
+    """Queue that calls notify() after every put so the consumer can wake without polling."""
+
+    def __init__(self, notify=None):
+        super().__init__()
+        self.notify = notify
+
+    def put(self, item, block=True, timeout=None):
+        super().put(item, block, timeout)
+        if self.notify:
+            try:
+                self.notify()
+            except Exception:
+                pass
+
+
+_font_cache = {}
+
+def get_font(size, weight="normal"):
+    """Shared CTkFont per (size, weight); created on first use, once a Tk root exists."""
+    key = (size, weight)
+    font = _font_cache.get(key)
+    if font is None:
+        font = _font_cache[key] = ctk.CTkFont(size=size, weight=weight)
+    return font
+
+
+_http_session = None
+# Read size for streamed binary downloads (app installer, yt-dlp.exe, both tens of MB)
+HTTP_DOWNLOAD_CHUNK = 1 << 18
+
+def get_http_session():
+    """Shared requests.Session so GitHub API calls and downloads reuse pooled connections."""
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        session = requests.Session()
+        session.headers["User-Agent"] = f"{APP_NAME}/{APP_VERSION}"
+        # Short retry on dropped connections / gateway errors; the pooled connection is kept
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _http_session = session
+    return _http_session
+
+
+def hidden_popen_kwargs(**kwargs):
+    """Popen kwargs shared by every yt-dlp call: no console window, no inherited stdin."""
+    popen_kwargs = {"stdin": subprocess.DEVNULL, "close_fds": True}
+    popen_kwargs.update(kwargs)
+    if _is_windows():
+        si = subprocess.STARTUPINFO()
+        si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        si.wShowWindow = subprocess.SW_HIDE
+        popen_kwargs["startupinfo"] = si
+        popen_kwargs["creationflags"] = 0x08000000  # CREATE_NO_WINDOW
+    return popen_kwargs
+
+
 def run_subprocess_safe(cmd, timeout=300, cwd=None, capture_output=True):
     """
     Run subprocess in a consistent way, capture stdout/stderr, return dict:
     { 'returncode': int, 'stdout': str, 'stderr': str, 'timed_out': bool }
     """
     try:
-        popen_kwargs = {"stdout": subprocess.PIPE if capture_output else None,
-                        "stderr": subprocess.PIPE if capture_output else None,
-                        "text": True}
-        if _is_windows():
-            si = subprocess.STARTUPINFO()
-            si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            si.wShowWindow = subprocess.SW_HIDE
-            popen_kwargs["startupinfo"] = si
-            popen_kwargs["creationflags"] = 0x08000000
+        popen_kwargs = hidden_popen_kwargs(
+            stdout=subprocess.PIPE if capture_output else None,
+            stderr=subprocess.PIPE if capture_output else None,
+            # explicit UTF-8: the locale codec (cp1252) chokes on non-Latin output
+            encoding="utf-8", errors="replace",
+        )
         proc = subprocess.Popen(cmd, cwd=cwd, **popen_kwargs)
         try:
             out, err = proc.communicate(timeout=timeout)
@@ -123,6 +236,7 @@ def run_subprocess_safe(cmd, timeout=300, cwd=None, capture_output=True):
 # --------------------------------------------
 
 _SAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9 ._\-()]')
+_COLLAPSE_UNDERSCORE_RE = re.compile(r'_{2,}')
 
 
 
@@ -174,7 +288,7 @@ def safe_filename(name: str, max_len=200, default="file"):
     # replace illegal characters
     cleaned = _SAFE_FILENAME_RE.sub("_", name)
     # collapse repeated underscores
-    cleaned = re.sub(r'_{2,}', '_', cleaned).strip(" _")
+    cleaned = _COLLAPSE_UNDERSCORE_RE.sub("_", cleaned).strip(" _")
     if not cleaned:
         return default
     # trim length but preserve extension if present
@@ -216,21 +330,33 @@ def open_log_file():
         messagebox.showerror(APP_NAME, f"Unable to open log file:\n{e}")
 
 HISTORY_MAX_ENTRIES = 200
+HISTORY_RENDER_BATCH = 20   # history rows built per UI tick
 TEMP_FILE_MAX_AGE_DAYS = 7
 
 def ensure_directories():
     """Ensure required directories exist and purge stale temp files."""
     DOWNLOADS_DIR.mkdir(parents=True, exist_ok=True)
     TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    _migrate_legacy_history()
     _purge_old_temp_files()
 
+_asset_names_cache = None
+
+def asset_names(refresh=False):
+    """File names present in Assets/, from a single scandir (memoized)."""
+    global _asset_names_cache
+    if _asset_names_cache is None or refresh:
+        try:
+            with os.scandir(ASSETS_DIR) as it:
+                _asset_names_cache = frozenset(e.name for e in it)
+        except OSError:
+            _asset_names_cache = frozenset()
+    return _asset_names_cache
+
 def check_executables():
     """Check for required executables in Assets/."""
-    missing = []
-    for exe in [YT_DLP_EXE, FFMPEG_EXE, FFPROBE_EXE]:
-        if not exe.exists():
-            missing.append(exe.name)
-    return missing
+    names = asset_names()
+    return [exe.name for exe in (YT_DLP_EXE, FFMPEG_EXE, FFPROBE_EXE) if exe.name not in names]
 
 # --------------------------------------------
 # Settings & History JSON
@@ -250,73 +376,284 @@ DEFAULT_SETTINGS = {
 # -------------------------------------------------------------------------------
 
 
+# Parsed file contents keyed by (mtime_ns, size); unchanged files skip the JSON parse
+_settings_cache = {"key": None, "data": None}
+_history_cache = {"key": None, "data": None}
+
+
+def _file_cache_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def load_settings():
     """Load settings from JSON file, falling back to defaults."""
-    if not SETTINGS_FILE.exists():
+    key = _file_cache_key(SETTINGS_FILE)
+    if key is None:
         # Don't save immediately - defer to first actual change
         return DEFAULT_SETTINGS.copy()
+    if key == _settings_cache["key"]:
+        return _settings_cache["data"].copy()
     try:
         with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
             data = json.load(f)
         # Merge with defaults efficiently
-        return {**DEFAULT_SETTINGS, **data}
+        merged = {**DEFAULT_SETTINGS, **data}
     except Exception:
         return DEFAULT_SETTINGS.copy()
+    _settings_cache["key"] = key
+    _settings_cache["data"] = merged
+    return merged.copy()
 
 def save_settings(settings):
+    _settings_cache["key"] = None
     try:
         ok = safe_write_json(SETTINGS_FILE, settings)
         if not ok:
             log_message("save_settings: safe_write_json returned False")
+        else:
+            # Write-through: the next load_settings() serves what was just written
+            _settings_cache["data"] = {**DEFAULT_SETTINGS, **settings}
+            _settings_cache["key"] = _file_cache_key(SETTINGS_FILE)
     except Exception as e:
         log_message(f"Failed to save settings: {e}")
 
 
+# Compact encoding for history records; settings.json keeps indent=2 since it is hand-edited
+_HISTORY_JSON_SEPARATORS = (",", ":")
+
+
+def json_loads(text):
+    """Parse JSON text with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def history_json_line(entry):
+    """Compact, non-ASCII-escaped JSON for one history.ndjson line."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(entry).decode("utf-8")
+        except TypeError:
+            pass  # e.g. non-str keys; stdlib handles those
+    return json.dumps(entry, ensure_ascii=False, separators=_HISTORY_JSON_SEPARATORS)
+
+
+def _read_history_lines():
+    """Parse history.ndjson (oldest first), applying tombstones and skipping blank or corrupt lines."""
+    global _history_line_count, _history_tombstones
+    entries = []
+    lines = tombstones = 0
+    try:
+        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                lines += 1
+                try:
+                    record = json_loads(line)
+                except Exception:
+                    continue
+                if isinstance(record, dict) and HISTORY_TOMBSTONE_KEY in record:
+                    # Drops the most recent earlier copy of the deleted record
+                    tombstones += 1
+                    target = record[HISTORY_TOMBSTONE_KEY]
+                    for i in range(len(entries) - 1, -1, -1):
+                        if entries[i] == target:
+                            del entries[i]
+                            break
+                    continue
+                entries.append(record)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        log_message(f"Failed to read history: {e}")
+    _history_line_count = lines
+    _history_tombstones = tombstones
+    return entries
+
+
+def _rewrite_history(entries_newest_first):
+    """Atomically replace history.ndjson with the given entries (compaction)."""
+    lines = [history_json_line(e) for e in reversed(entries_newest_first)]
+    text = "\n".join(lines) + "\n" if lines else ""
+    global _history_line_count, _history_tombstones
+    _history_cache["key"] = None
+    # History is a rebuildable log (appends aren't synced either); settings keep fsync
+    if safe_write_text(HISTORY_FILE, text, fsync=False):
+        _history_line_count = len(lines)
+        _history_tombstones = 0
+
+
 def load_history():
+    flush_history()
     # Fix: Acquire lock even for reading to ensure we don't read partial writes
     with _HISTORY_RW_LOCK:
-        data = safe_read_json(HISTORY_FILE, default=[])
-        if data is None:
-            return []
-        return data
+        key = _file_cache_key(HISTORY_FILE)
+        if key is not None and key == _history_cache["key"]:
+            return list(_history_cache["data"])
+        # File is append-only (oldest first); callers expect newest first
+        entries = _read_history_lines()
+        entries.reverse()
+        entries = entries[:HISTORY_MAX_ENTRIES]
+        _history_cache["key"] = key
+        _history_cache["data"] = entries
+        return list(entries)
+
+
+def _migrate_legacy_history():
+    """One-time conversion of history.json (newest-first list) to history.ndjson."""
+    try:
+        if HISTORY_FILE.exists() or not LEGACY_HISTORY_FILE.exists():
+            return
+        with _HISTORY_RW_LOCK:
+            data = safe_read_json(LEGACY_HISTORY_FILE, default=[])
+            if not isinstance(data, list):
+                data = []
+            _rewrite_history(data[:HISTORY_MAX_ENTRIES])
+            if HISTORY_FILE.exists():
+                LEGACY_HISTORY_FILE.replace(LEGACY_HISTORY_FILE.with_suffix(".json.bak"))
+    except Exception as e:
+        log_message(f"History migration failed: {e}")
 
 
-def _purge_old_temp_files():
-    """Delete temp files older than TEMP_FILE_MAX_AGE_DAYS. Best-effort, never raises."""
+def _purge_old_temp_files(max_age_seconds=TEMP_FILE_MAX_AGE_DAYS * 86400):
+    """Delete temp files older than max_age_seconds. Best-effort, never raises."""
     try:
-        cutoff = time.time() - TEMP_FILE_MAX_AGE_DAYS * 86400
-        for p in TEMP_DIR.iterdir():
-            try:
-                if p.is_file() and p.stat().st_mtime < cutoff:
-                    p.unlink(missing_ok=True)
-            except Exception:
-                pass
+        cutoff = time.time() - max_age_seconds
+        # One directory scan; on Windows DirEntry carries the file times, so no stat per file
+        with os.scandir(TEMP_DIR) as it:
+            for e in it:
+                try:
+                    # .lock files may be held by a writer (see _acquire_file_lock)
+                    if e.name.endswith(".lock"):
+                        continue
+                    if e.is_file(follow_symlinks=False) and e.stat(follow_symlinks=False).st_mtime < cutoff:
+                        os.unlink(e.path)
+                except Exception:
+                    pass
     except Exception:
         pass
 
 
+def list_file_names(directory):
+    """Names of the regular files directly inside directory (one scandir, no per-file stat)."""
+    with os.scandir(directory) as it:
+        return {e.name for e in it if e.is_file(follow_symlinks=False)}
+
+
+def newest_new_file(directory, known_names, skip_suffix=".info.json"):
+    """Path of the most recently modified file not in known_names, or None."""
+    newest, newest_mtime = None, None
+    with os.scandir(directory) as it:
+        for e in it:
+            if e.name in known_names or e.name.endswith(skip_suffix):
+                continue
+            if not e.is_file(follow_symlinks=False):
+                continue
+            mtime = e.stat(follow_symlinks=False).st_mtime
+            if newest_mtime is None or mtime > newest_mtime:
+                newest, newest_mtime = e.path, mtime
+    return newest
+
+
+# Lines currently in history.ndjson (None until first counted); used to decide when to compact
+_history_line_count = None
+# Deletes append {"_tombstone": <record>} lines; the file is compacted once they pass
+# HISTORY_TOMBSTONE_RATIO of its lines
+HISTORY_TOMBSTONE_KEY = "_tombstone"
+HISTORY_TOMBSTONE_RATIO = 0.25
+_history_tombstones = 0
+
+
+# Write-behind buffer: finished downloads queue their record here and it reaches disk
+# in one append per batch. Readers (load/delete/clear) flush first, and so does exit.
+HISTORY_FLUSH_INTERVAL = 2.0
+HISTORY_FLUSH_BATCH = 20
+_history_pending = []
+_history_pending_lock = threading.Lock()
+_history_flush_timer = None
+
+
 def append_history(entry):
-    # Fix: Atomic read-modify-write cycle
+    """Queue one record for history.ndjson; written within HISTORY_FLUSH_INTERVAL seconds."""
+    global _history_flush_timer
+    with _history_pending_lock:
+        _history_pending.append(entry)
+        flush_now = len(_history_pending) >= HISTORY_FLUSH_BATCH
+        if not flush_now and _history_flush_timer is None:
+            _history_flush_timer = threading.Timer(HISTORY_FLUSH_INTERVAL, flush_history)
+            _history_flush_timer.daemon = True
+            _history_flush_timer.start()
+    if flush_now:
+        flush_history()
+
+
+def flush_history():
+    """Write queued history records in one append; compacts once the file holds 2x the cap."""
+    global _history_line_count, _history_flush_timer
+    with _history_pending_lock:
+        batch = _history_pending[:]
+        _history_pending.clear()
+        if _history_flush_timer is not None:
+            _history_flush_timer.cancel()
+            _history_flush_timer = None
+    if not batch:
+        return
     with _HISTORY_RW_LOCK:
-        history = load_history() or []
-        history.insert(0, entry)
+        try:
+            if _history_line_count is None:
+                _read_history_lines()
+            _history_cache["key"] = None
+            with open(HISTORY_FILE, "a", encoding="utf-8", buffering=1 << 16) as f:
+                f.write("".join(history_json_line(e) + "\n" for e in batch))
+            _history_line_count += len(batch)
+        except Exception as e:
+            log_message(f"Failed to append history: {e}")
+            return
         # Cap history to prevent unbounded growth
-        if len(history) > HISTORY_MAX_ENTRIES:
-            history = history[:HISTORY_MAX_ENTRIES]
-        safe_write_json(HISTORY_FILE, history)
+        if _history_line_count > HISTORY_MAX_ENTRIES * 2:
+            _rewrite_history(load_history())
+
+
+atexit.register(flush_history)
 
 
-def delete_history_entry(index):
-    # Fix: Atomic read-modify-write cycle
+def delete_history_entry(index, expected=None):
+    """Remove one record by appending a tombstone line; compacts once tombstones pile up."""
+    global _history_line_count, _history_tombstones
     with _HISTORY_RW_LOCK:
         history = load_history()
-        if history and 0 <= index < len(history):
-            history.pop(index)
-            safe_write_json(HISTORY_FILE, history)
+        if expected is not None and not (0 <= index < len(history) and history[index] == expected):
+            # File changed since the caller read it (e.g. a download finished); find the record
+            index = next((i for i, e in enumerate(history) if e == expected), -1)
+        if not (history and 0 <= index < len(history)):
+            return
+        removed = history.pop(index)
+        if _history_line_count is None:
+            _read_history_lines()
+        if (_history_tombstones + 1) > HISTORY_TOMBSTONE_RATIO * (_history_line_count + 1):
+            _rewrite_history(history)
+            return
+        try:
+            with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+                f.write(history_json_line({HISTORY_TOMBSTONE_KEY: removed}) + "\n")
+        except Exception as e:
+            log_message(f"Failed to delete history entry: {e}")
+            _history_cache["key"] = None
+            return
+        _history_line_count += 1
+        _history_tombstones += 1
 
 def clear_history():
+    flush_history()
     with _HISTORY_RW_LOCK:
-        safe_write_json(HISTORY_FILE, [])
+        _rewrite_history([])
 
 # --------------------------------------------
 # Utility
@@ -331,80 +668,113 @@ def windows_quote(path):
 
 def is_youtube_url(url):
     """Basic check if URL is a YouTube URL."""
+    u = url.strip().lower()
+    if u.startswith(_URL_SCHEMES):
+        u = u.split("://", 1)[1]
+    if u.startswith(_YOUTUBE_HOSTS):
+        # Require something after the host, like the regex's trailing ".+"
+        return len(u) > u.index("/") + 1
+    # Slow path for anything the prefix table doesn't cover
     return bool(YOUTUBE_URL_RE.match(url.strip()))
 
+def extract_video_id(url):
+    """Extract the 11-character video ID from a YouTube URL, or None."""
+    try:
+        u = (url or "").strip()
+        # Single regex pass covers watch?v=, youtu.be/, /embed/, /shorts/ and /v/
+        m = _VID_RE.search(u)
+        if m:
+            return m.group(1)
+        # Fallback for unusual layouts the regex can't anchor on
+        parsed = urlparse(u)
+        if parsed.netloc and "youtu.be" in parsed.netloc:
+            return parsed.path.lstrip("/") or None
+        qs = parse_qs(parsed.query)
+        if qs.get("v"):
+            return qs["v"][0]
+        return None
+    except Exception:
+        return None
+
 def now_str():
     """Get current datetime as string."""
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 # ---------- Atomic JSON write/read with optional file lock ----------
 _FILE_LOCK_TIMEOUT = 5.0  # seconds for lock attempts
+_FILE_LOCK_RETRY = 0.02
 
 def _acquire_file_lock(lock_path, timeout=_FILE_LOCK_TIMEOUT):
     """
-    Best-effort cross-process lock:
-    Try to create a lock file atomically (O_CREAT|O_EXCL).
-    Return a file descriptor which should be closed/unlinked by caller.
-    If can't acquire within timeout, raise TimeoutError.
+    Cross-process lock: a non-blocking OS lock on lock_path (msvcrt on Windows,
+    flock elsewhere), retried until timeout. The kernel releases it if the holder
+    dies, so a crashed writer can't leave a stale lock behind.
+    Return a file descriptor for _release_file_lock.
+    If it can't be acquired within timeout, raise TimeoutError.
     """
-
-    import errno
-
-    start = time.monotonic()
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT)
+    deadline = time.monotonic() + timeout
     while True:
         try:
-            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-            # write pid for debugging
-            try:
-                os.write(fd, str(os.getpid()).encode("utf-8"))
-            except Exception:
-                pass
+            if msvcrt is not None:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
             return fd
-        except OSError as e:
-            if e.errno != errno.EEXIST:
-                raise
-            if time.monotonic() - start > timeout:
+        except OSError:
+            if time.monotonic() >= deadline:
+                os.close(fd)
                 raise TimeoutError(f"Could not acquire lock {lock_path}")
-            time.sleep(0.05)
+            time.sleep(_FILE_LOCK_RETRY)
 
 def _release_file_lock(fd, lock_path):
     try:
-        os.close(fd)
+        if msvcrt is not None:
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        # flock is dropped by close()
     except Exception:
         pass
     try:
-        os.unlink(lock_path)
+        os.close(fd)
     except Exception:
         pass
 
 
 
 
-def safe_write_json(path: Path, data, *, lock_suffix=".lock"):
-    """Write JSON atomically using tempfile + os.replace with optional lock."""
+def safe_write_text(path: Path, text, *, fsync=True, lock_suffix=".lock"):
+    """Write text atomically using tempfile + os.replace with optional lock.
+
+    fsync=False skips forcing the temp file to disk before the replace; for data
+    where losing the last few seconds on a power cut is acceptable.
+    """
     path = Path(path)
-    lock_path = str(path) + lock_suffix
+    # Lock files live in TEMP_DIR, not next to the user's data; they are reused, never unlinked
+    TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    lock_path = str(TEMP_DIR / (path.name + lock_suffix))
     fd = None
     try:
         try:
             fd = _acquire_file_lock(lock_path)
         except TimeoutError:
             # fallback to in-process lock only (best-effort)
-            log_message(f"safe_write_json: lock timeout for {path}, proceeding without lock")
+            log_message(f"safe_write_text: lock timeout for {path}, proceeding without lock")
             fd = None
 
         # write to temp file in same dir to ensure os.replace is atomic
         dirpath = path.parent
         dirpath.mkdir(parents=True, exist_ok=True)
         with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=str(dirpath), delete=False) as tf:
-            json.dump(data, tf, indent=2, ensure_ascii=False)
-            tf.flush()
-            os.fsync(tf.fileno())
+            tf.write(text)
+            if fsync:
+                tf.flush()
+                os.fsync(tf.fileno())
             tmpname = tf.name
         os.replace(tmpname, str(path))
         return True
     except Exception as e:
-        log_message(f"safe_write_json failed for {path}: {e}")
+        log_message(f"safe_write_text failed for {path}: {e}")
         try:
             if 'tmpname' in locals() and os.path.exists(tmpname):
                 os.unlink(tmpname)
@@ -418,6 +788,15 @@ def safe_write_json(path: Path, data, *, lock_suffix=".lock"):
             except Exception:
                 pass
 
+def safe_write_json(path: Path, data, *, fsync=True, lock_suffix=".lock"):
+    """Write JSON atomically using tempfile + os.replace with optional lock."""
+    try:
+        text = json.dumps(data, indent=2, ensure_ascii=False)
+    except Exception as e:
+        log_message(f"safe_write_json failed for {path}: {e}")
+        return False
+    return safe_write_text(path, text, fsync=fsync, lock_suffix=lock_suffix)
+
 def safe_read_json(path: Path, default=None, *, lock_suffix=".lock"):
     """Read JSON file; if it fails return default. We don't lock on read to avoid contention."""
     try:
@@ -434,6 +813,45 @@ def safe_read_json(path: Path, default=None, *, lock_suffix=".lock"):
 def _is_windows():
     return sys.platform.startswith("win")
 
+DWMWA_WINDOW_CORNER_PREFERENCE = 33
+DWMWCP_ROUND = 2
+_win32_funcs = None
+
+def _win32():
+    """GetParent and DwmSetWindowAttribute, bound once with explicit argtypes (Windows only).
+
+    Also carries c_int, byref and sizeof(c_int) so dwm_set_int_attribute needs no per-call import.
+    """
+    global _win32_funcs
+    if _win32_funcs is None:
+        import ctypes
+        from ctypes import wintypes
+        get_parent = ctypes.WinDLL("user32", use_last_error=True).GetParent
+        get_parent.argtypes = [wintypes.HWND]
+        get_parent.restype = wintypes.HWND
+        set_attr = ctypes.WinDLL("dwmapi").DwmSetWindowAttribute
+        set_attr.argtypes = [wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD]
+        set_attr.restype = ctypes.c_long  # HRESULT
+        _win32_funcs = (get_parent, set_attr, ctypes.c_int, ctypes.byref, ctypes.sizeof(ctypes.c_int))
+    return _win32_funcs
+
+def dwm_set_int_attribute(hwnd, attribute, value):
+    """DwmSetWindowAttribute for the common int-valued attributes."""
+    _, set_attr, c_int, byref, int_size = _win32()
+    v = c_int(value)
+    return set_attr(hwnd, attribute, byref(v), int_size)
+
+def round_window_corners(window):
+    """Ask DWM for Windows 11 rounded corners on a Tk toplevel."""
+    hwnd = _win32()[0](window.winfo_id())
+    dwm_set_int_attribute(hwnd, DWMWA_WINDOW_CORNER_PREFERENCE, DWMWCP_ROUND)
+
+# Toast opacity ramps (0.1 steps, peak 0.95), one frame every TOAST_FADE_STEP_MS
+TOAST_FADE_STEP_MS = 20
+_TOAST_FADE_IN = tuple(round(min(0.1 * i, 0.95), 2) for i in range(1, 11))
+_TOAST_FADE_OUT = tuple(round(0.95 - 0.1 * i, 2) for i in range(1, 10))
+
+
 def show_toast(root, message, title=None, timeout=3000, level="info", theme="dark"):
     """Non-blocking themed toast with Windows 11 styling."""
     try:
@@ -455,10 +873,10 @@ def show_toast(root, message, title=None, timeout=3000, level="info", theme="dar
         frame.pack(fill="both", expand=True, padx=2, pady=2)
         
         title_text = title or ""
-        lbl_title = ctk.CTkLabel(frame, text=title_text, anchor="w", font=ctk.CTkFont(size=12, weight="bold"))
+        lbl_title = ctk.CTkLabel(frame, text=title_text, anchor="w", font=get_font(12, "bold"))
         if title_text:
             lbl_title.pack(fill="x", padx=16, pady=(12, 0))
-        lbl = ctk.CTkLabel(frame, text=message, anchor="w", font=ctk.CTkFont(size=11))
+        lbl = ctk.CTkLabel(frame, text=message, anchor="w", font=get_font(11))
         lbl.pack(fill="both", padx=16, pady=(8, 14))
         
         try:
@@ -468,43 +886,50 @@ def show_toast(root, message, title=None, timeout=3000, level="info", theme="dar
         except Exception:
             toast.geometry("340x90+100+100")
         
-        # Fade in effect
+        # Fade in, then out after timeout: every frame is scheduled up front as a bound
+        # attributes() call instead of a chain of re-arming closures
         toast.attributes("-alpha", 0.0)
-        def fade_in(alpha=0.0):
-            if alpha < 0.95:
-                alpha += 0.1
-                toast.attributes("-alpha", alpha)
-                toast.after(20, lambda: fade_in(alpha))
-            else:
-                toast.attributes("-alpha", 0.95)
-        fade_in()
-        
-        # Auto-destroy with fade out
-        def fade_out(alpha=0.95):
-            if alpha > 0:
-                alpha -= 0.1
-                try:
-                    toast.attributes("-alpha", alpha)
-                    toast.after(20, lambda: fade_out(alpha))
-                except:
-                    pass
-            else:
+        fade_ids = [toast.after(TOAST_FADE_STEP_MS * i, toast.attributes, "-alpha", alpha)
+                    for i, alpha in enumerate(_TOAST_FADE_IN, 1)]
+        fade_ids += [toast.after(timeout + TOAST_FADE_STEP_MS * i, toast.attributes, "-alpha", alpha)
+                     for i, alpha in enumerate(_TOAST_FADE_OUT)]
+        fade_ids.append(toast.after(timeout + TOAST_FADE_STEP_MS * len(_TOAST_FADE_OUT), toast.destroy))
+
+        # Destroyed early (dismissed, or the root closing): drop the frames still pending
+        def cancel_fade(event):
+            if event.widget is not toast:
+                return
+            for after_id in fade_ids:
                 try:
-                    toast.destroy()
-                except:
+                    toast.after_cancel(after_id)
+                except Exception:
                     pass
-        toast.after(timeout, lambda: fade_out())
+        toast.bind("<Destroy>", cancel_fade, add="+")
     except Exception:
         pass
 
 # ------------------ Windows Native Notification ------------------
 
+# win11toast blocks until the toast is dismissed, so calls run on a small fixed pool
+# instead of one new thread per notification
+NOTIFY_MAX_WORKERS = 2
+_notify_pool = None
+
+
+def get_notify_pool():
+    global _notify_pool
+    if _notify_pool is None:
+        _notify_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=NOTIFY_MAX_WORKERS, thread_name_prefix="notify")
+    return _notify_pool
+
+
 def windows_notify(title, message, open_path=None):
     """Show a Windows 11 toast notification.
 
     Clicking the notification brings the Clipster window to the front.
     If open_path is given and exists, it is also opened in Explorer.
-    Uses a background thread for the blocking win11toast call so the
+    Uses a bounded background pool for the blocking win11toast call so the
     main thread is never stalled.
     """
     if not _is_windows():
@@ -523,7 +948,7 @@ def windows_notify(title, message, open_path=None):
 
             # App icon in the notification badge
             icon_path = ASSETS_DIR / "clipster.png"
-            if icon_path.exists():
+            if icon_path.name in asset_names():
                 kwargs["icon"] = {"src": str(icon_path), "placement": "appLogoOverride"}
 
             # on_click: bring window to front, optionally open the folder.
@@ -553,7 +978,7 @@ def windows_notify(title, message, open_path=None):
         except Exception as e:
             log_message(f"windows_notify error: {e}")
 
-    threading.Thread(target=_fire, daemon=True).start()
+    get_notify_pool().submit(_fire)
 
 
 def _bring_window_to_front():
@@ -608,8 +1033,152 @@ def _toast(app, message, title=None, timeout=3000, level="info"):
 # --------------------------------------------
 # Metadata via yt-dlp --dump-json (blocking small call)
 # --------------------------------------------
-def fetch_metadata_via_yt_dlp(url, timeout=30):
+def iter_output_lines(stream, chunk_size=1 << 16):
+    """
+    Yield stripped, non-empty text lines from a binary pipe.
+    Reads whatever is available (read1) and decodes incrementally as UTF-8,
+    splitting on both newlines and carriage returns so progress updates are seen.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    while True:
+        chunk = stream.read1(chunk_size)
+        text = pending + decoder.decode(chunk, final=not chunk)
+        parts = text.replace("\r", "\n").split("\n")
+        # Last piece is an incomplete line until the next chunk (or EOF) arrives
+        pending = parts.pop() if chunk else ""
+        for part in parts:
+            part = part.strip()
+            if part:
+                yield part
+        if not chunk:
+            break
+
+
+def iter_yt_dlp_json(cmd, timeout=60):
+    """
+    Run yt-dlp and yield each JSON record from its stdout as soon as it is complete.
+    stderr is merged into stdout; non-JSON lines are collected and raised as
+    RuntimeError if yt-dlp exits with a non-zero code.
+    Raises subprocess.TimeoutExpired if the process runs longer than timeout.
+    """
+    popen_kwargs = hidden_popen_kwargs(stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1 << 16)
+    proc = subprocess.Popen(cmd, **popen_kwargs)
+    timed_out = threading.Event()
+
+    def _kill_on_timeout():
+        timed_out.set()
+        try:
+            proc.kill()
+        except Exception:
+            pass
+
+    timer = threading.Timer(timeout, _kill_on_timeout)
+    timer.daemon = True
+    timer.start()
+    decoder = json.JSONDecoder()
+    errors = []
+    try:
+        for line in iter_output_lines(proc.stdout):
+            if line.startswith("{"):
+                try:
+                    obj = json_loads(line)
+                except ValueError:
+                    # Tolerate trailing text after the object
+                    try:
+                        obj, _ = decoder.raw_decode(line)
+                    except ValueError:
+                        errors.append(line)
+                        continue
+                yield obj
+            else:
+                errors.append(line)
+        ret = proc.wait()
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        if ret != 0:
+            raise RuntimeError("\n".join(errors).strip() or f"yt-dlp exited with code {ret}")
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            try:
+                proc.kill()
+            except Exception:
+                pass
+        try:
+            proc.stdout.close()
+        except Exception:
+            pass
+
+
+# In-memory metadata cache: url -> (fetched_at, info). Playlist dumps expire sooner
+# because items get added/removed; per-video metadata rarely changes within a day.
+META_CACHE_TTL = 24 * 60 * 60
+META_CACHE_MAX_ENTRIES = 256
+PLAYLIST_CACHE_TTL = 10 * 60
+# Flat-playlist rows are sent to the UI in groups of this size (or after this many seconds)
+PLAYLIST_ADD_BATCH = 20
+PLAYLIST_ADD_FLUSH_INTERVAL = 0.25
+_meta_cache = OrderedDict()
+_playlist_cache = OrderedDict()
+_meta_cache_lock = threading.Lock()
+
+
+def _cache_get(cache, key, ttl):
+    with _meta_cache_lock:
+        hit = cache.get(key)
+        if hit is None:
+            return None
+        if time.monotonic() - hit[0] > ttl:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return hit[1]
+
+
+def _cache_put(cache, key, value):
+    with _meta_cache_lock:
+        cache[key] = (time.monotonic(), value)
+        cache.move_to_end(key)
+        while len(cache) > META_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+
+
+def new_info_json_stem():
+    """Unique TEMP_DIR stem for one download's metadata file (see start_download's info_json_stem)."""
+    return TEMP_DIR / f"info_{uuid.uuid4().hex}"
+
+
+def read_info_json_sidecar(stem):
+    """Load and delete the <stem>.info.json yt-dlp wrote for a download; {} if missing."""
+    if not stem:
+        return {}
+    info_path = Path(f"{stem}.info.json")
+    try:
+        with open(info_path, "r", encoding="utf-8") as f:
+            info = json.load(f)
+    except Exception:
+        return {}
+    try:
+        info_path.unlink()
+    except Exception:
+        pass
+    return info
+
+
+def clear_metadata_cache():
+    """Forget all cached video and playlist metadata."""
+    with _meta_cache_lock:
+        _meta_cache.clear()
+        _playlist_cache.clear()
+
+
+def fetch_metadata_via_yt_dlp(url, timeout=30, use_cache=True):
     """Fetch video metadata using yt-dlp; hides console window on Windows."""
+    if use_cache:
+        cached = _cache_get(_meta_cache, url, META_CACHE_TTL)
+        if cached is not None:
+            return cached
     if not YT_DLP_EXE.exists():
         raise FileNotFoundError("yt-dlp.exe not found in Assets/")
     cmd = [
@@ -622,37 +1191,60 @@ def fetch_metadata_via_yt_dlp(url, timeout=30):
         url
     ]
     try:
-        # Windows: hide window
-        kwargs = {"capture_output": True, "text": True, "timeout": timeout}
-        if _is_windows():
-            # Use STARTUPINFO to hide
-            si = subprocess.STARTUPINFO()
-            si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            si.wShowWindow = subprocess.SW_HIDE
-            kwargs["startupinfo"] = si
-            kwargs["creationflags"] = 0x08000000  # CREATE_NO_WINDOW
-        proc = subprocess.run(cmd, **kwargs)
-        out = proc.stdout.strip()
-        if proc.returncode != 0:
-            stderr = (proc.stderr or "").strip() or out
-            if any(x in stderr for x in ("Sign in to confirm your age", "members-only", "This video is only available for members")):
-                raise RuntimeError("This video is age-restricted or members-only and requires sign-in. Clipster cannot download it.")
-            raise RuntimeError(stderr or "yt-dlp failed to fetch metadata")
-        if not out:
-            raise RuntimeError("No metadata returned by yt-dlp")
-        # find the first JSON object in output
-        first_json = None
-        for line in out.splitlines():
-            if line.strip().startswith("{"):
-                first_json = line
-                break
-        if first_json is None:
-            first_json = out
-        return json.loads(first_json)
+        for info in iter_yt_dlp_json(cmd, timeout=timeout):
+            _cache_put(_meta_cache, url, info)
+            return info
     except subprocess.TimeoutExpired:
         raise RuntimeError("yt-dlp timed out while fetching metadata")
-    except json.JSONDecodeError as e:
-        raise RuntimeError(f"Failed to parse yt-dlp output as JSON: {e}")
+    except RuntimeError as e:
+        stderr = str(e)
+        if any(x in stderr for x in ("Sign in to confirm your age", "members-only", "This video is only available for members")):
+            raise RuntimeError("This video is age-restricted or members-only and requires sign-in. Clipster cannot download it.")
+        raise RuntimeError(stderr or "yt-dlp failed to fetch metadata")
+    raise RuntimeError("No metadata returned by yt-dlp")
+
+
+# URLs resolved per yt-dlp process when several are pasted at once; batches still run in parallel
+META_BATCH_SIZE = 4
+
+
+def fetch_metadata_batch(urls, timeout=None):
+    """Fetch metadata for several video URLs with one yt-dlp run; returns {url: info}.
+
+    URLs yt-dlp could not resolve are left out, so callers can retry them with
+    fetch_metadata_via_yt_dlp() to get a specific error message.
+    """
+    found = {}
+    pending = []
+    for url in urls:
+        cached = _cache_get(_meta_cache, url, META_CACHE_TTL)
+        if cached is not None:
+            found[url] = cached
+        elif url not in pending:
+            pending.append(url)
+    if not pending or not YT_DLP_EXE.exists():
+        return found
+    cmd = [
+        YT_DLP_EXE,
+        "--no-warnings",
+        "--skip-download",
+        "--no-playlist",
+        "--dump-json",
+        "--no-check-certificates",
+        "--ignore-errors",
+        *pending
+    ]
+    wanted = set(pending)
+    try:
+        for info in iter_yt_dlp_json(cmd, timeout=timeout or 30 + 10 * len(pending)):
+            url = info.get("original_url")
+            if url in wanted:
+                _cache_put(_meta_cache, url, info)
+                found[url] = info
+    except (RuntimeError, subprocess.TimeoutExpired) as e:
+        # Any failed URL makes yt-dlp exit non-zero; keep the ones it did resolve
+        log_message(f"fetch_metadata_batch: {str(e)[:300]}")
+    return found
 # ---------------------------------------------------------------------------------------
 
 
@@ -664,8 +1256,12 @@ class DownloadProcess:
     def __init__(self):
         self.proc = None
         self._lock = threading.Lock()
+        # Cancel event of the current run; each start_download gets a fresh one so a new
+        # item can't un-cancel a previous run whose reader thread is still winding down
+        self._cancel_event = threading.Event()
 
     def shutdown(self):
+        self._cancel_event.set()
         with self._lock:
             if self.proc and self.proc.poll() is None:
                 try:
@@ -678,19 +1274,26 @@ class DownloadProcess:
             self.proc = None
 
 
-    def start_download(self, url, outdir, filename_template, format_selector, cookies_path=None, progress_callback=None, finished_callback=None, error_callback=None):
-        """Start a download thread."""
-        thread = threading.Thread(target=self._run_download, args=(url, outdir, filename_template, format_selector, cookies_path, progress_callback, finished_callback, error_callback), daemon=True)
+    def start_download(self, url, outdir, filename_template, format_selector, cookies_path=None, progress_callback=None, finished_callback=None, error_callback=None, info_json_stem=None, cancelled_callback=None):
+        """Start a download thread. A cancelled run calls cancelled_callback(), not error_callback."""
+        cancel_event = self._cancel_event = threading.Event()
+        thread = threading.Thread(target=self._run_download, args=(url, outdir, filename_template, format_selector, cookies_path, progress_callback, finished_callback, error_callback, info_json_stem, cancel_event, cancelled_callback), daemon=True)
         thread.start()
         return thread
 
-    def _run_download(self, url, outdir, filename_template, format_selector, cookies_path, progress_callback, finished_callback, error_callback):
+    def _run_download(self, url, outdir, filename_template, format_selector, cookies_path, progress_callback, finished_callback, error_callback, info_json_stem=None, cancel_event=None, cancelled_callback=None):
         """Internal method to run yt-dlp subprocess (hidden window on Windows)."""
+        if cancel_event is None:
+            cancel_event = self._cancel_event
         if not YT_DLP_EXE.exists():
             if error_callback: error_callback("yt-dlp.exe not found in Assets/")
             return
         outtmpl = os.path.join(outdir, filename_template)
-        cmd = [windows_quote(str(YT_DLP_EXE)), "--no-warnings", "--newline", "--continue"]
+        cmd = [windows_quote(str(YT_DLP_EXE)), "--no-warnings", "--newline", "--continue", "--encoding", "utf-8"]
+        if info_json_stem:
+            # <stem>.info.json saves a second metadata call after the download. It goes to
+            # TEMP_DIR, never the user's download folder (yt-dlp writes it before the media)
+            cmd += ["--write-info-json", "-o", f"infojson:{info_json_stem}.%(ext)s"]
         if cookies_path:
             cmd += ["--cookies", windows_quote(cookies_path)]
         if format_selector == "__mp3__":
@@ -705,23 +1308,18 @@ class DownloadProcess:
                 cmd += ["-o", outtmpl, "-f", format_selector, url]
 
         try:
-            popen_kwargs = {"stdout": subprocess.PIPE, "stderr": subprocess.STDOUT, "text": True, "bufsize": 1, "universal_newlines": True}
-            if _is_windows():
-                si = subprocess.STARTUPINFO()
-                si.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                si.wShowWindow = subprocess.SW_HIDE
-                popen_kwargs["startupinfo"] = si
-                popen_kwargs["creationflags"] = 0x08000000  # CREATE_NO_WINDOW
+            # Binary pipe + one incremental decode per chunk (see iter_output_lines)
+            popen_kwargs = hidden_popen_kwargs(stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1 << 16)
             with subprocess.Popen(cmd, **popen_kwargs) as p:
                 with self._lock:
                     self.proc = p
                 output_path = None
-                for raw_line in p.stdout:
-                    if raw_line is None:
-                        continue
-                    line = raw_line.strip()
+                last_emit = 0.0
+                for line in iter_output_lines(p.stdout):
+                    if cancel_event.is_set():
+                        break
                     # age-restricted detection
-                    if any(x in line for x in ("Sign in to confirm your age", "This video is only available for members", "This video is private")):
+                    if any(x in line for x in _AUTH_ERRS):
                         if error_callback:
                             error_callback("Age-restricted or members-only content detected. Clipster cannot download without authentication.")
                         try:
@@ -730,30 +1328,44 @@ class DownloadProcess:
                             pass
                         return
                     # percent parsing
-                    match = YT_DLP_PROGRESS_RE.search(line)
+                    # Lines arrive stripped, so progress lines start with "[download]"; the
+                    # anchored match rejects everything else without scanning the line
+                    match = YT_DLP_LINE_RE.match(line) if line.startswith("[download]") else None
                     percent = None
                     speed = None
                     eta = None
                     if match:
                         try:
-                            percent = float(match.group(1))
+                            percent = float(match["pct"])
                         except:
                             percent = None
-                    sp = YT_DLP_SPEED_RE.search(line)
-                    if sp:
-                        speed = sp.group(1)
-                    etam = YT_DLP_ETA_RE.search(line)
-                    if etam:
-                        eta = etam.group(1)
-                    if line.startswith("Destination:"):
-                        # yt-dlp prints Destination: path
-                        output_path = line.partition("Destination:")[2].strip()
-                    if progress_callback:
-                        progress_callback(percent, speed, eta, line)
+                        speed = match["speed"]
+                        eta = match["eta"]
+                    if line.startswith("["):
+                        # Last reported path wins: merge/extract output replaces the stream files
+                        dest = parse_ytdlp_output_path(line)
+                        if dest:
+                            output_path = dest
+                    # Throttle to ~30 Hz; non-progress lines would only reset bars to 0
+                    if progress_callback and percent is not None:
+                        now = time.monotonic()
+                        if percent >= 100.0 or now - last_emit >= PROGRESS_EMIT_INTERVAL:
+                            last_emit = now
+                            progress_callback(percent, speed, eta, line)
+                if cancel_event.is_set():
+                    # Don't wait for yt-dlp to drain its pipe after a cancel
+                    try:
+                        p.kill()
+                    except Exception:
+                        pass
                 ret = p.wait()
                 with self._lock:
-                    self.proc = None
-                if ret == 0:
+                    if self.proc is p:
+                        self.proc = None
+                if cancel_event.is_set():
+                    if cancelled_callback:
+                        cancelled_callback()
+                elif ret == 0:
                     if finished_callback:
                         finished_callback(output_path)
                 else:
@@ -761,14 +1373,20 @@ class DownloadProcess:
                         error_callback(f"yt-dlp exited with code {ret}")
 
         except Exception as e:
-            if error_callback:
+            if cancel_event.is_set():
+                if cancelled_callback:
+                    cancelled_callback()
+            elif error_callback:
                 error_callback(str(e))
         finally:
             with self._lock:
-                self.proc = None
+                # Only drop an exited process; a newer run may already own self.proc
+                if self.proc is not None and self.proc.poll() is not None:
+                    self.proc = None
 
     def cancel(self):
         """Cancel the running download process."""
+        self._cancel_event.set()
         with self._lock:
             if self.proc and self.proc.poll() is None:
                 try:
@@ -781,6 +1399,16 @@ class DownloadProcess:
 
 
 
+def parse_ytdlp_output_path(line):
+    """Return the file path announced by a yt-dlp output line, or None."""
+    for prefix in _YT_DLP_DEST_PREFIXES:
+        if line.startswith(prefix):
+            return line[len(prefix):].strip().strip('"') or None
+    if line.startswith("[download] ") and line.endswith(_YT_DLP_ALREADY_SUFFIX):
+        return line[len("[download] "):-len(_YT_DLP_ALREADY_SUFFIX)].strip() or None
+    return None
+
+
 # --------------------------------------------
 # Format selector helpers
 # --------------------------------------------
@@ -828,16 +1456,12 @@ def parse_available_resolutions(formats_list, target_ext="mp4"):
     """
     if not formats_list:
         return ["Best Available"]
-    seen = set()
-    for f in formats_list:
-        h = f.get("height")
-        vcodec = f.get("vcodec", "none")
-        if h and vcodec and vcodec != "none":
-            seen.add(h)
-    heights = sorted(seen, reverse=True)
-    heights = [h for h in heights if h >= 144]
-    labels = ["Best Available"] + [f"{h}p" for h in heights]
-    return labels if labels else ["Best Available"]
+    # Single pass over integer heights; labels are formatted only once, after sorting
+    heights = {
+        h for f in formats_list
+        if (h := f.get("height")) and h >= 144 and f.get("vcodec", "none") not in (None, "", "none")
+    }
+    return ["Best Available"] + [f"{h}p" for h in sorted(heights, reverse=True)]
 
 
 def estimate_filesize_bytes(formats_list, target_format, resolution_label):
@@ -942,17 +1566,14 @@ class ClipsterApp:
 
     def get_executor(self):
         if self._executor is None:
-            import concurrent.futures
             self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=6)
         return self._executor
 
     def run_bg(self, func, *args):
-        if getattr(self, "_executor", None):
-            self.get_executor().submit(func, *args)
+        return self.get_executor().submit(func, *args)
 
 
     def __init__(self, root):
-        import concurrent.futures
         self.root = root
 
         # enable toasts on root
@@ -968,7 +1589,7 @@ class ClipsterApp:
         # Set window icon — will be reinforced by _create_titlebar via WM_SETICON
         try:
             ico_path = ASSETS_DIR / "clipster.ico"
-            if ico_path.exists():
+            if ico_path.name in asset_names():
                 self.root.iconbitmap(default=str(ico_path))
         except Exception:
             pass
@@ -977,35 +1598,63 @@ class ClipsterApp:
         # proper window style application before visibility
         self.root.withdraw()
 
+        # Pending after() ids from _schedule, cancelled on close so nothing fires into dead widgets
+        self._after_ids = set()
+
         ensure_directories()
         # Defer executable checks to after UI is shown to speed up initial render
-        self.root.after(800, self._deferred_executables_check)
+        self._schedule(800, self._deferred_executables_check)
 
 
         self.settings = load_settings()
         self.history = []
         self._history_loaded = False
+        # Deletes and clears reach disk on one writer thread; the Tk thread only edits self.history
+        self._history_write_q = queue.Queue()
+        self._history_reload_skipped = False
+        self._history_writer = threading.Thread(target=self._history_writer_loop, daemon=True)
+        self._history_writer.start()
 
         ctk.set_appearance_mode(self.settings.get("theme", "dark"))
 
         self.download_proc = DownloadProcess()
+        # One DownloadProcess per in-flight playlist item (see on_download_playlist)
+        self._playlist_procs = set()
+        self._playlist_procs_lock = threading.Lock()
         self._executor = None
-        self.ui_queue = queue.Queue()
+        # Workers wake the Tk loop via <<UIQueue>> instead of a 100 ms poll
+        self._ui_wake_pending = False
+        self._ui_backlog = []
+        self._active_info_top = None
+        self._history_refresh_scheduled = False
+        self._ui_handlers = self._build_ui_handlers()
+        self._pl_progress_pending = None
+        # vids whose playlist_seq_item_done was already handled in the current run
+        self._finalized_vids = set()
+        self._dl_render_dirty = False
+        self._dl_summary_dirty = False
+        self.ui_queue = _NotifyingQueue(self._wake_ui_queue)
+        self.root.bind("<<UIQueue>>", lambda e: self._drain_ui_queue(), add="+")
         self.current_task_cancelled = False
+        # Event twin of current_task_cancelled so worker loops can block instead of polling
+        self._task_cancel_event = threading.Event()
 
         # caches and mappings
         self._playlist_row_by_vid = {}
-        self._playlist_row_order = []
+        # Parallel per-row arrays in display order (index i is the same row in each)
+        self._playlist_rows = []
+        self._playlist_selected_vars = []
+        self._playlist_selected_urls = []
 
 
 
         self._build_skeleton_ui()
-        self.root.after(50, self._build_ui)
-        self.root.after(150, self._enable_mica_effect)
-        self.root.after(100, self._process_ui_queue)
+        self._schedule(50, self._build_ui)
+        self._schedule(150, self._enable_mica_effect)
+        self._schedule(UI_QUEUE_FALLBACK_MS, self._process_ui_queue)
 
         # Show window after setup to avoid flashing
-        self.root.after(0, self._show_window_after_setup)
+        self._schedule(0, self._show_window_after_setup)
 
     def _build_skeleton_ui(self):
         """Build minimal UI shell with custom animated tab system."""
@@ -1046,7 +1695,7 @@ class ClipsterApp:
                 tab_wrap,
                 text=f"{icon}  {name}",
                 height=36,
-                font=ctk.CTkFont(size=13),
+                font=get_font(13),
                 text_color="#777777",
                 padx=16,
             )
@@ -1082,7 +1731,7 @@ class ClipsterApp:
         self.tabs = _TabCompat(self._tab_frames)
 
         # Activate the first tab after UI settles (content not built yet)
-        self.root.after(60, lambda: self._switch_tab("Download", animated=False))
+        self._schedule(60, lambda: self._switch_tab("Download", animated=False))
 
     def _on_tab_hover(self, lbl, name, entering):
         """Lighten label on hover if not the active tab."""
@@ -1105,12 +1754,12 @@ class ClipsterApp:
         for n, (wrap, lbl, indicator) in self._tab_btns.items():
             if n == name:
                 lbl.configure(text_color="white",
-                              font=ctk.CTkFont(size=13, weight="bold"))
+                              font=get_font(13, "bold"))
                 indicator.pack(fill="x", padx=8, pady=(0, 0))
                 self._animate_indicator(indicator, 0, 1)
             else:
                 lbl.configure(text_color="#777777",
-                              font=ctk.CTkFont(size=13))
+                              font=get_font(13))
                 indicator.pack_forget()
 
         new_frame  = self._tab_frames[name]
@@ -1122,7 +1771,7 @@ class ClipsterApp:
             new_frame.lift()
             if prev_frame:
                 prev_frame.lower()
-            self.root.after(80, lambda: self._lazy_build_tab(name, new_frame, animated))
+            self._schedule(80, lambda: self._lazy_build_tab(name, new_frame, animated))
             return
 
         self._animate_tab_in(new_frame, prev_frame, animated)
@@ -1269,34 +1918,41 @@ class ClipsterApp:
         step()
 
 
-    def _check_for_updates(self):
-        """Check GitHub API for newer releases. Runs in background thread — no direct UI calls."""
-        import requests
+    def _check_for_updates(self, background=False):
+        """Check GitHub API for newer releases. Runs in background thread — no direct UI calls.
+
+        background=True is the silent startup check: no status text, and a toast
+        only when a newer version exists.
+        """
+        def status(msg):
+            if not background:
+                self.ui_queue.put(("update_status", msg))
         # Signal UI that check has started
-        self.ui_queue.put(("update_status", "Checking GitHub..."))
+        status("Checking GitHub...")
         try:
-            r = requests.get(GITHUB_API_LATEST, timeout=6)
+            r = get_http_session().get(GITHUB_API_LATEST, timeout=6)
             if r.status_code != 200:
-                self.ui_queue.put(("update_status", f"Failed to fetch release info ({r.status_code})"))
+                status(f"Failed to fetch release info ({r.status_code})")
                 return
             data = r.json()
             latest = data.get("tag_name", "").lstrip("v")
             if not latest:
-                self.ui_queue.put(("update_status", "No valid release found."))
+                status("No valid release found.")
                 return
             if latest == APP_VERSION:
-                self.ui_queue.put(("update_status", f"✅ You’re running the latest version ({APP_VERSION})."))
+                status(f"✅ You’re running the latest version ({APP_VERSION}).")
             else:
-                self.ui_queue.put(("update_available", latest, data))
+                self.ui_queue.put(("update_available", latest, data, background))
         except Exception as e:
-            self.ui_queue.put(("update_status", f"Failed to check updates: {e}"))
+            if background:
+                log_message(f"Startup update check failed: {e}")
+            status(f"Failed to check updates: {e}")
 
     def _check_update_button(self):
-        threading.Thread(target=self._check_for_updates, daemon=True).start()
+        self.run_bg(self._check_for_updates)
 
     def _download_and_install_update(self):
         """Download latest EXE in a background thread to avoid freezing the UI."""
-        import requests
         data = getattr(self, "latest_release_data", None)
         if not data:
             messagebox.showinfo(APP_NAME, "Please check for updates first.")
@@ -1316,22 +1972,26 @@ class ClipsterApp:
         self.ui_queue.put(("update_status", "Starting download..."))
 
         def _do_download():
-            import requests
             try:
-                new_exe_path = TEMP_DIR / "Clipster_Update.exe"
-                with requests.get(exe_url, stream=True, timeout=30) as r:
+                # Unique name so a second click can't write into a file still being downloaded
+                new_exe_path = TEMP_DIR / f"Clipster_Update_{uuid.uuid4().hex}.exe"
+                with get_http_session().get(exe_url, stream=True, timeout=30) as r:
                     r.raise_for_status()
                     total = int(r.headers.get("Content-Length", 0))
                     with open(new_exe_path, "wb") as f:
                         downloaded = 0
-                        for chunk in r.iter_content(chunk_size=8192):
+                        last_percent = None
+                        for chunk in r.iter_content(chunk_size=HTTP_DOWNLOAD_CHUNK):
                             if not chunk:
                                 continue
                             f.write(chunk)
                             downloaded += len(chunk)
                             if total:
                                 percent = downloaded * 100 // total
-                                self.ui_queue.put(("update_status", f"Downloading... {percent}%"))
+                                # Only post when the text would change (once per percent, not per chunk)
+                                if percent != last_percent:
+                                    last_percent = percent
+                                    self.ui_queue.put(("update_status", f"Downloading... {percent}%"))
                 self.ui_queue.put(("update_install", str(new_exe_path)))
             except Exception as e:
                 self.ui_queue.put(("update_status", f"Download failed: {e}"))
@@ -1369,12 +2029,24 @@ class ClipsterApp:
         self.root.lift()
         self.root.focus_force()
         self.root.update_idletasks()
+        # Silent update check, kept well clear of the first paint
+        self._schedule(STARTUP_UPDATE_CHECK_DELAY_MS, lambda: self.run_bg(self._check_for_updates, True))
+
+    def _get_hwnd(self):
+        """Top-level HWND of the root window, looked up once along with user32."""
+        hwnd = getattr(self, "_hwnd", None)
+        if not hwnd:
+            import ctypes
+            self._user32 = ctypes.windll.user32
+            # Typed GetParent from _win32(): the untyped call truncates the HWND to a C int
+            hwnd = self._hwnd = _win32()[0](self.root.winfo_id())
+        return hwnd
 
     def _create_titlebar(self):
         """Create a modern custom titlebar with Windows 11 styling."""
         import ctypes
         
-        hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+        hwnd = self._get_hwnd()
         
         # ── Apply window styles early to ensure taskbar integration ───────────────
         # This MUST happen before any UI setup and before the window becomes visible
@@ -1388,28 +2060,21 @@ class ClipsterApp:
         # the Alt+Tab switcher, and the window's own system menu.
         ico_path = ASSETS_DIR / "clipster.ico"
         try:
-            if ico_path.exists():
+            if ico_path.name in asset_names():
                 # Load as HICON (LR_LOADFROMFILE = 0x10, IMAGE_ICON = 1)
                 ICON_SMALL = 0
                 ICON_BIG   = 1
                 WM_SETICON = 0x0080
-                hicon_big = ctypes.windll.user32.LoadImageW(
+                hicon_big = self._user32.LoadImageW(
                     None, str(ico_path), 1, 0, 0, 0x10
                 )
-                hicon_small = ctypes.windll.user32.LoadImageW(
+                hicon_small = self._user32.LoadImageW(
                     None, str(ico_path), 1, 16, 16, 0x10
                 )
                 if hicon_big:
-                    ctypes.windll.user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, hicon_big)
+                    self._user32.SendMessageW(hwnd, WM_SETICON, ICON_BIG, hicon_big)
                 if hicon_small:
-                    ctypes.windll.user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, hicon_small)
-        except Exception:
-            pass
-
-        # Also keep Tkinter's own reference so it doesn't get GC'd
-        try:
-            if ico_path.exists():
-                self.root.iconbitmap(default=str(ico_path))
+                    self._user32.SendMessageW(hwnd, WM_SETICON, ICON_SMALL, hicon_small)
         except Exception:
             pass
 
@@ -1422,9 +2087,7 @@ class ClipsterApp:
 
         # Rounded corners (Windows 11)
         try:
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, 33, ctypes.byref(ctypes.c_int(2)), ctypes.sizeof(ctypes.c_int)
-            )
+            dwm_set_int_attribute(hwnd, DWMWA_WINDOW_CORNER_PREFERENCE, DWMWCP_ROUND)
         except Exception:
             pass
 
@@ -1438,32 +2101,37 @@ class ClipsterApp:
         left = ctk.CTkFrame(self.titlebar_frame, fg_color="transparent")
         left.pack(side="left", padx=(10, 4), pady=4)
 
-        icon_lbl = ctk.CTkLabel(left, text="▶", font=ctk.CTkFont(size=14), width=20)
+        icon_lbl = ctk.CTkLabel(left, text="▶", font=get_font(14), width=20)
         icon_lbl.pack(side="left")
 
-        def load_titlebar_icon():
+        self._titlebar_icon_lbl = icon_lbl
+
+        def decode_titlebar_icon():
+            # PIL decode runs off the UI thread; the CTkImage is built in _handle_ui_event
             try:
-                png_path = BASE_DIR / "Assets" / "clipster.png"
-                if png_path.exists():
-                    img = get_pil_image().open(png_path).convert("RGBA")
-                    img.thumbnail((22, 22))
-                    ctkimg = ctk.CTkImage(img, size=(22, 22))
-                    icon_lbl.configure(image=ctkimg, text="")
-                    icon_lbl.image = ctkimg
+                png_path = ASSETS_DIR / "clipster.png"
+                if png_path.name in asset_names():
+                    PILImage = get_pil_image()
+                    img = PILImage.open(png_path)
+                    if img.mode != "RGBA":
+                        img = img.convert("RGBA")
+                    # Bilinear is indistinguishable from bicubic at 22 px and cheaper
+                    img.thumbnail((22, 22), PILImage.Resampling.BILINEAR)
+                    self.ui_queue.put(("titlebar_icon_ready", img))
             except Exception:
                 pass
-        self.root.after(200, load_titlebar_icon)
+        threading.Thread(target=decode_titlebar_icon, daemon=True).start()
 
         self._title_lbl = ctk.CTkLabel(
             left, text=APP_NAME,
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=get_font(13, "bold")
         )
         self._title_lbl.pack(side="left", padx=(8, 4))
 
         # Version badge
         self._version_badge = ctk.CTkLabel(
             left, text=f"v{APP_VERSION}",
-            font=ctk.CTkFont(size=10),
+            font=get_font(10),
             fg_color=ACCENT_COLOR, corner_radius=6,
             width=46, height=20, text_color="white"
         )
@@ -1471,7 +2139,7 @@ class ClipsterApp:
 
         self._subtitle_lbl = ctk.CTkLabel(
             left, text=SPLASH_TEXT,
-            font=ctk.CTkFont(size=10), text_color="#888888"
+            font=get_font(10), text_color="#888888"
         )
         self._subtitle_lbl.pack(side="left")
 
@@ -1490,7 +2158,7 @@ class ClipsterApp:
         self._min_btn = ctk.CTkButton(
             btns, text="—", width=36, height=30, corner_radius=7,
             fg_color="transparent", hover_color="#3A3A3A",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             command=self._minimize_window
         )
         self._min_btn.pack(side="left", padx=2)
@@ -1498,7 +2166,7 @@ class ClipsterApp:
         self._max_btn = ctk.CTkButton(
             btns, text="□", width=36, height=30, corner_radius=7,
             fg_color="transparent", hover_color="#3A3A3A",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             command=self._toggle_max_restore
         )
         self._max_btn.pack(side="left", padx=2)
@@ -1506,7 +2174,7 @@ class ClipsterApp:
         self._close_btn = ctk.CTkButton(
             btns, text="✕", width=36, height=30, corner_radius=7,
             fg_color="transparent", hover_color="#C42B1C",
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             command=self._close_window
         )
         self._close_btn.pack(side="left", padx=2)
@@ -1515,8 +2183,7 @@ class ClipsterApp:
 
     def _enable_mica_effect(self):
         """Enable Mica effect on Windows 11."""
-        import ctypes
-        hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+        hwnd = self._get_hwnd()
 
         DWMWA_SYSTEMBACKDROP_TYPE = 38
         DWMWA_MICA_EFFECT = 1029
@@ -1525,20 +2192,14 @@ class ClipsterApp:
 
         try:
             dark_mode = 1 if self.settings.get("theme", "dark") == "dark" else 0
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE, ctypes.byref(ctypes.c_int(dark_mode)), ctypes.sizeof(ctypes.c_int)
-            )
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, DWMWA_SYSTEMBACKDROP_TYPE, ctypes.byref(ctypes.c_int(DWMSBT_MAINWINDOW)), ctypes.sizeof(ctypes.c_int)
-            )
+            dwm_set_int_attribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE, dark_mode)
+            dwm_set_int_attribute(hwnd, DWMWA_SYSTEMBACKDROP_TYPE, DWMSBT_MAINWINDOW)
         except Exception as e:
             log_message(f"[Mica] Warning: could not enable Mica effect: {e}")
 
     def _set_window_styles(self):
         """Set window styles to remove native titlebar but keep taskbar presence."""
-        import ctypes
-
-        hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+        hwnd = self._get_hwnd()
 
         # ── Strip native titlebar chrome ──────────────────────────────
         # Keep WS_OVERLAPPED (0x00000000 base) + WS_VISIBLE (0x10000000)
@@ -1562,47 +2223,45 @@ class ClipsterApp:
         WS_EX_APPWINDOW  = 0x00040000
         WS_EX_TOOLWINDOW = 0x00000080
 
-        style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_STYLE)
+        style = self._user32.GetWindowLongW(hwnd, GWL_STYLE)
         # Clear caption/border bits, keep sysmenu + thickframe + visible
         style = (style & ~(WS_CAPTION | WS_BORDER | WS_DLGFRAME)) | WS_SYSMENU | WS_THICKFRAME | WS_VISIBLE
-        ctypes.windll.user32.SetWindowLongW(hwnd, GWL_STYLE, style)
+        self._user32.SetWindowLongW(hwnd, GWL_STYLE, style)
 
-        exstyle = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
+        exstyle = self._user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
         exstyle = (exstyle & ~WS_EX_TOOLWINDOW) | WS_EX_APPWINDOW
-        ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, exstyle)
+        self._user32.SetWindowLongW(hwnd, GWL_EXSTYLE, exstyle)
 
         # Apply the style change without moving/sizing the window
         SWP_NOMOVE    = 0x0002
         SWP_NOSIZE    = 0x0001
         SWP_NOZORDER  = 0x0004
         SWP_FRAMECHANGED = 0x0020
-        ctypes.windll.user32.SetWindowPos(
+        self._user32.SetWindowPos(
             hwnd, None, 0, 0, 0, 0,
             SWP_NOMOVE | SWP_NOSIZE | SWP_NOZORDER | SWP_FRAMECHANGED
         )
 
     def _begin_native_drag(self, event):
         """Start native window drag using Windows API."""
-        import ctypes
-        hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+        hwnd = self._get_hwnd()
         WM_SYSCOMMAND = 0x0112
         SC_MOVE = 0xF010
         HTCAPTION = 0x0002
-        ctypes.windll.user32.ReleaseCapture()
-        ctypes.windll.user32.PostMessageW(hwnd, WM_SYSCOMMAND, SC_MOVE + HTCAPTION, 0)
+        self._user32.ReleaseCapture()
+        self._user32.PostMessageW(hwnd, WM_SYSCOMMAND, SC_MOVE + HTCAPTION, 0)
 
     def _toggle_max_restore(self):
         """Toggle maximize/restore window state."""
-        import ctypes
-        hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+        hwnd = self._get_hwnd()
 
         if not self._is_maximized:
             self._prev_geom = self.root.geometry()
-            ctypes.windll.user32.ShowWindow(hwnd, 3)  # SW_MAXIMIZE
+            self._user32.ShowWindow(hwnd, 3)  # SW_MAXIMIZE
             self._is_maximized = True
             self._max_btn.configure(text="⧈")
         else:
-            ctypes.windll.user32.ShowWindow(hwnd, 9)  # SW_RESTORE
+            self._user32.ShowWindow(hwnd, 9)  # SW_RESTORE
             self._is_maximized = False
             self._max_btn.configure(text="□")
         self._animate_window("show")
@@ -1612,11 +2271,33 @@ class ClipsterApp:
         self._animate_window("hide")
         self.root.iconify()
 
+    def _schedule(self, ms, func, *args):
+        """root.after that remembers the id so _close_window can cancel it."""
+        aid = None
+
+        def _run():
+            self._after_ids.discard(aid)
+            func(*args)
+
+        aid = self.root.after(ms, _run)
+        self._after_ids.add(aid)
+        return aid
+
+    def _cancel_scheduled(self):
+        """Cancel every callback still pending from _schedule."""
+        for aid in list(self._after_ids):
+            try:
+                self.root.after_cancel(aid)
+            except Exception:
+                pass
+        self._after_ids.clear()
+
     def _close_window(self):
         try:
             self.graceful_shutdown()
         except Exception:
             pass
+        self._cancel_scheduled()
         try:
             self.root.quit()
             self.root.destroy()
@@ -1627,12 +2308,17 @@ class ClipsterApp:
         """Safely shut down downloads, background workers, and temp files."""
         try:
             self.current_task_cancelled = True
+            self._task_cancel_event.set()
 
             # Cancel active yt-dlp process
             try:
                 if self.download_proc:
                     self.download_proc.cancel()
                     self.download_proc.shutdown()
+                with self._playlist_procs_lock:
+                    procs = list(self._playlist_procs)
+                for proc in procs:
+                    proc.shutdown()
             except Exception:
                 pass
 
@@ -1649,26 +2335,21 @@ class ClipsterApp:
                 finally:
                     self._executor = None
 
+            # Let queued history deletes/clears reach disk before exit
+            self._history_write_q.put(None)
+            self._history_writer.join(timeout=2)
+
         except Exception as e:
             log_message(f"graceful_shutdown error: {e}")
 
         # Cleanup old temp files (best-effort)
-        try:
-            for p in TEMP_DIR.iterdir():
-                try:
-                    if p.is_file() and (time.time() - p.stat().st_mtime) > 24 * 60 * 60:
-                        p.unlink(missing_ok=True)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+        _purge_old_temp_files(24 * 60 * 60)
 
 
 
     def _animate_window(self, action="show"):
         """Animate window show/hide using Windows API."""
-        import ctypes
-        hwnd = ctypes.windll.user32.GetParent(self.root.winfo_id())
+        hwnd = self._get_hwnd()
 
         AW_BLEND = 0x00080000
         AW_CENTER = 0x00000010
@@ -1677,7 +2358,7 @@ class ClipsterApp:
 
         flags = AW_BLEND | AW_CENTER | (AW_HIDE if action == "hide" else AW_ACTIVATE)
         try:
-            ctypes.windll.user32.AnimateWindow(hwnd, 200, flags)
+            self._user32.AnimateWindow(hwnd, 200, flags)
         except Exception:
             pass
 
@@ -1692,12 +2373,13 @@ class ClipsterApp:
             self.root.configure(fg_color=ctk.ThemeManager.theme["CTkFrame"]["fg_color"])
         except Exception:
             pass
-        if self._history_loaded:
-            self.refresh_history()
-        else:
-            self.root.after(300, self.load_and_render_history)
+        # existing CTk widgets recolor themselves on appearance change, so the
+        # history rows don't need rebuilding here
+        if not self._history_loaded:
+            self._schedule(300, self.load_and_render_history)
         self._update_titlebar_theme()
         self._enable_mica_effect()
+        # one paint for all of the above
         self.root.update_idletasks()
 
     def _on_theme_combo_changed(self, choice):
@@ -1734,7 +2416,6 @@ class ClipsterApp:
 
     def _make_menu_window(self, x, y, width=0):
         """Create and style a floating menu window (shared by dropdown + context menu)."""
-        import ctypes
         theme = self.settings.get("theme", "dark")
         is_dark = theme != "light"
 
@@ -1758,10 +2439,7 @@ class ClipsterApp:
 
         # Windows 11 rounded corners
         try:
-            hwnd = ctypes.windll.user32.GetParent(menu_win.winfo_id())
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, 33, ctypes.byref(ctypes.c_int(2)), ctypes.sizeof(ctypes.c_int)
-            )
+            round_window_corners(menu_win)
         except Exception:
             pass
 
@@ -1801,7 +2479,7 @@ class ClipsterApp:
         lbl = ctk.CTkLabel(
             row, text=f"  {label}",
             anchor="w",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             text_color=text_color,
             height=32,
             padx=6,
@@ -1827,21 +2505,17 @@ class ClipsterApp:
             w.bind("<Leave>", on_leave)
             w.bind("<Button-1>", on_click)
 
-    def _animate_menu_in(self, menu_win, steps=8, target=0.97):
-        """Fade + subtle scale-in animation for menu windows."""
-        def step(i=0):
+    def _animate_menu_in(self, menu_win, target=0.97):
+        """Reveal a menu window at its final opacity once it has been laid out."""
+        # Native menus don't fade; one alpha change replaces the old 8-step ramp.
+        # Tk's -alpha already maps to SetLayeredWindowAttributes on Windows.
+        def show():
             try:
-                if not menu_win.winfo_exists():
-                    return
-                progress = i / steps
-                ease = 1 - (1 - progress) ** 2
-                alpha = target * ease
-                menu_win.wm_attributes("-alpha", min(alpha, target))
-                if i < steps:
-                    menu_win.after(12, lambda: step(i + 1))
+                if menu_win.winfo_exists():
+                    menu_win.wm_attributes("-alpha", target)
             except Exception:
                 pass
-        menu_win.after(10, lambda: step(0))
+        menu_win.after(10, show)
 
     def _show_custom_dropdown(self, parent_widget, values, on_select):
         """Show a polished custom dropdown below parent_widget."""
@@ -1947,26 +2621,26 @@ class ClipsterApp:
         url_bar.pack(fill="x", padx=10, pady=(12, 6))
         self.dl_url_entry = ctk.CTkEntry(
             url_bar, placeholder_text="Paste a YouTube URL and press Enter or click Add ↵",
-            height=42, corner_radius=10, font=ctk.CTkFont(size=13)
+            height=42, corner_radius=10, font=get_font(13)
         )
         self.dl_url_entry.pack(side="left", fill="x", expand=True, padx=(0, 8))
         self.dl_url_entry.bind("<Return>", lambda e: self._dl_add_url())
         ctk.CTkButton(
             url_bar, text="Add  +", fg_color=ACCENT_COLOR, hover_color=ACCENT_HOVER,
-            width=90, height=42, corner_radius=10, font=ctk.CTkFont(size=13, weight="bold"),
+            width=90, height=42, corner_radius=10, font=get_font(13, "bold"),
             command=self._dl_add_url
         ).pack(side="left")
 
         # ── Queue list ─────────────────────────────────────────────────
         ctk.CTkLabel(frame, text="Download Queue", anchor="w",
-                     font=ctk.CTkFont(size=13, weight="bold")).pack(anchor="w", padx=12, pady=(8, 4))
+                     font=get_font(13, "bold")).pack(anchor="w", padx=12, pady=(8, 4))
         self.dl_queue_scroll = ctk.CTkScrollableFrame(frame, corner_radius=12)
         self.dl_queue_scroll.pack(fill="both", expand=True, padx=10, pady=(0, 4))
 
         self._dl_empty_label = ctk.CTkLabel(
             self.dl_queue_scroll,
             text="No videos added yet. Paste a URL above to get started.",
-            text_color="#888888", font=ctk.CTkFont(size=12)
+            text_color="#888888", font=get_font(12)
         )
         self._dl_empty_label.pack(pady=40)
 
@@ -1985,13 +2659,13 @@ class ClipsterApp:
 
         self.dl_summary_lbl = ctk.CTkLabel(
             summary, text="No videos queued",
-            font=ctk.CTkFont(size=11), text_color="#888888", anchor="w"
+            font=get_font(11), text_color="#888888", anchor="w"
         )
         self.dl_summary_lbl.grid(row=1, column=0, sticky="w", padx=(10, 0), pady=(0, 6))
 
         self.dl_speed_lbl = ctk.CTkLabel(
             summary, text="",
-            font=ctk.CTkFont(size=11), text_color="#aaaaaa", anchor="e"
+            font=get_font(11), text_color="#aaaaaa", anchor="e"
         )
         self.dl_speed_lbl.grid(row=1, column=2, sticky="e", padx=(0, 10), pady=(0, 6))
 
@@ -2006,7 +2680,7 @@ class ClipsterApp:
         ).pack(side="right", padx=(4, 12))
         self.dl_download_btn = ctk.CTkButton(
             ctrl, text="⏬  Download All", fg_color=ACCENT_COLOR, hover_color=ACCENT_HOVER,
-            width=160, height=38, corner_radius=10, font=ctk.CTkFont(size=13, weight="bold"),
+            width=160, height=38, corner_radius=10, font=get_font(13, "bold"),
             command=self._dl_start_all
         )
         self.dl_download_btn.pack(side="right", padx=4)
@@ -2017,24 +2691,46 @@ class ClipsterApp:
     # ──────────────────────────────────────────────────────────────
 
     def _dl_add_url(self):
-        url = self.dl_url_entry.get().strip()
-        if not url:
+        raw = self.dl_url_entry.get().strip()
+        if not raw:
             return
 
-        if YOUTUBE_PLAYLIST_RE.match(url):
+        # Several URLs can be pasted at once, separated by spaces or newlines
+        urls = raw.split()
+
+        if len(urls) == 1 and YOUTUBE_PLAYLIST_RE.match(urls[0]):
             # Show inline playlist panel in the Download tab
             self.dl_url_entry.delete(0, "end")
-            self._dl_show_playlist_panel(url)
+            self._dl_show_playlist_panel(urls[0])
             return
 
-        if not YOUTUBE_URL_RE.match(url):
+        valid = [u for u in urls if is_youtube_url(u)]
+        if not valid:
             _toast(self, "Not a valid YouTube URL.", level="error")
             return
 
         self.dl_url_entry.delete(0, "end")
 
         default_fmt = self.settings.get("default_format", "mp4")
+        if len(valid) == 1:
+            self._dl_queue_url(valid[0], default_fmt)
+        else:
+            # A few URLs per yt-dlp process instead of one process per URL
+            queued = [self._dl_queue_url(url, default_fmt, fetch=False) for url in valid]
+            for i in range(0, len(queued), META_BATCH_SIZE):
+                self.run_bg(self._dl_fetch_meta_batch, queued[i:i + META_BATCH_SIZE])
+
+        # One render for the whole paste, not one per URL
+        self._dl_render_queue()
+        self._dl_update_summary()
+        self._dl_start_fetch_animation()
 
+        skipped = len(urls) - len(valid)
+        if skipped:
+            _toast(self, f"Skipped {skipped} invalid URL(s).", level="error")
+
+    def _dl_queue_url(self, url, default_fmt, fetch=True):
+        """Append one video URL to the queue and (unless fetch=False) fetch its metadata in the background."""
         entry = {
             "url":    url,
             "title":  url,
@@ -2060,31 +2756,47 @@ class ClipsterApp:
             idx = len(self._dl_queue)
             self._dl_queue.append(entry)
 
-        self._dl_render_queue()
-        self._dl_update_summary()
-        self._dl_start_fetch_animation()
+        if fetch:
+            # Pooled so pasting many URLs fetches metadata concurrently without a thread per URL
+            self.run_bg(self._dl_fetch_meta, idx, entry)
+        return idx, entry
 
-        def fetch_task(queue_idx, e):
-            try:
+    def _dl_fetch_meta(self, queue_idx, e, meta=None):
+        """Fill a queue entry from its metadata (fetched here unless given) and notify the UI."""
+        try:
+            if meta is None:
                 meta = fetch_metadata_via_yt_dlp(e["url"])
-                e["title"]       = meta.get("title", e["url"])
-                e["uploader"]    = meta.get("uploader", "")
-                e["duration"]    = meta.get("duration_string", "")
-                e["formats_raw"] = meta.get("formats", [])
-                e["available_resolutions"] = parse_available_resolutions(e["formats_raw"])
-                if e["selected_res"] not in e["available_resolutions"]:
-                    e["selected_res"] = "Best Available"
-                e["filesize_bytes"] = estimate_filesize_bytes(
-                    e["formats_raw"], e["selected_fmt"], e["selected_res"]
-                )
-                e["fmt_selector"] = build_format_selector_for_format_and_res(
-                    e["selected_fmt"], e["selected_res"]
-                )
-                self.ui_queue.put(("dl_meta_ready", queue_idx))
-            except Exception as ex:
-                self.ui_queue.put(("dl_item_status", queue_idx, "error", str(ex)))
+            e["title"]       = meta.get("title", e["url"])
+            e["uploader"]    = meta.get("uploader", "")
+            e["duration"]    = meta.get("duration_string", "")
+            e["formats_raw"] = meta.get("formats", [])
+            e["available_resolutions"] = parse_available_resolutions(e["formats_raw"])
+            if e["selected_res"] not in e["available_resolutions"]:
+                e["selected_res"] = "Best Available"
+            e["filesize_bytes"] = estimate_filesize_bytes(
+                e["formats_raw"], e["selected_fmt"], e["selected_res"]
+            )
+            e["fmt_selector"] = build_format_selector_for_format_and_res(
+                e["selected_fmt"], e["selected_res"]
+            )
+            self.ui_queue.put(("dl_meta_ready", queue_idx))
+        except Exception as ex:
+            self.ui_queue.put(("dl_item_status", queue_idx, "error", str(ex)))
 
-        threading.Thread(target=fetch_task, args=(idx, entry), daemon=True).start()
+    def _dl_fetch_meta_batch(self, queued):
+        """Resolve several queued (idx, entry) pairs with one yt-dlp run."""
+        try:
+            found = fetch_metadata_batch([e["url"] for _, e in queued])
+        except Exception as ex:
+            log_message(f"metadata batch failed: {ex}")
+            found = {}
+        for queue_idx, e in queued:
+            meta = found.get(e["url"])
+            if meta is None:
+                # Not resolved in the batch: a single fetch reports the real error
+                self._dl_fetch_meta(queue_idx, e)
+            else:
+                self._dl_fetch_meta(queue_idx, e, meta)
 
     # ──────────────────────────────────────────────────────────────
     # Inline Playlist Panel (shown inside Download tab)
@@ -2101,7 +2813,7 @@ class ClipsterApp:
         # Header row
         hdr = ctk.CTkFrame(self._pl_panel, fg_color="transparent")
         hdr.pack(fill="x", padx=8, pady=(8, 4))
-        ctk.CTkLabel(hdr, text="📋 Playlist Downloader", font=ctk.CTkFont(size=13, weight="bold"), anchor="w").pack(side="left")
+        ctk.CTkLabel(hdr, text="📋 Playlist Downloader", font=get_font(13, "bold"), anchor="w").pack(side="left")
         ctk.CTkButton(hdr, text="✕ Close", fg_color="gray", width=80, height=28, corner_radius=6,
                       command=self._dl_dismiss_playlist_panel).pack(side="right")
 
@@ -2115,7 +2827,7 @@ class ClipsterApp:
                       width=110, command=self._pl_fetch_items).pack(side="left")
 
         # Progress label
-        self._pl_status_lbl = ctk.CTkLabel(self._pl_panel, text="", anchor="w", font=ctk.CTkFont(size=11))
+        self._pl_status_lbl = ctk.CTkLabel(self._pl_panel, text="", anchor="w", font=get_font(11))
         self._pl_status_lbl.pack(anchor="w", padx=10, pady=(2, 0))
 
         # Scrollable video list
@@ -2142,11 +2854,11 @@ class ClipsterApp:
 
         self._pl_rows = []  # list of (BoolVar, entry_dict)
         self._pl_empty_lbl = ctk.CTkLabel(self._pl_items_frame, text="Press 'Fetch Items' to load playlist videos.",
-                                          text_color="#888888", font=ctk.CTkFont(size=12))
+                                          text_color="#888888", font=get_font(12))
         self._pl_empty_lbl.pack(pady=20)
 
         # Kick off fetch automatically
-        self.root.after(100, self._pl_fetch_items)
+        self._schedule(100, self._pl_fetch_items)
 
     def _dl_dismiss_playlist_panel(self):
         """Remove the inline playlist panel if it exists."""
@@ -2178,37 +2890,35 @@ class ClipsterApp:
 
         self._pl_status_lbl.configure(text="⏳ Fetching playlist items...")
 
+        # A newer fetch supersedes this one: drop it if still queued, ignore its results if not
+        self._pl_fetch_gen = gen = getattr(self, "_pl_fetch_gen", 0) + 1
+        prev = getattr(self, "_pl_fetch_future", None)
+        if prev is not None:
+            prev.cancel()
+
         def task():
             try:
                 cmd = [
                     windows_quote(str(YT_DLP_EXE)),
                     "--no-warnings", "--flat-playlist", "--dump-json", url
                 ]
-                result = run_subprocess_safe(cmd, timeout=60)
-                if result["timed_out"]:
-                    raise RuntimeError("yt-dlp playlist fetch timed out.")
-                if result["returncode"] != 0:
-                    raise RuntimeError(result["stderr"] or "yt-dlp returned error")
-                lines = [l for l in result["stdout"].splitlines() if l.strip()]
                 seen_ids = set()
                 items = []
-                for line in lines:
-                    try:
-                        data = json.loads(line)
-                        vid_id = data.get("id") or data.get("url")
-                        if not vid_id or vid_id in seen_ids:
-                            continue
-                        seen_ids.add(vid_id)
-                        title = data.get("title") or "<No title>"
-                        full_url = f"https://youtube.com/watch?v={vid_id}"
-                        items.append({"title": title, "url": full_url, "id": vid_id})
-                    except Exception:
+                for data in iter_yt_dlp_json(cmd, timeout=60):
+                    vid_id = data.get("id") or data.get("url")
+                    if not vid_id or vid_id in seen_ids:
                         continue
-                self.ui_queue.put(("pl_inline_items_ready", items))
+                    seen_ids.add(vid_id)
+                    title = data.get("title") or "<No title>"
+                    full_url = f"https://youtube.com/watch?v={vid_id}"
+                    items.append({"title": title, "url": full_url, "id": vid_id})
+                self.ui_queue.put(("pl_inline_items_ready", items, gen))
+            except subprocess.TimeoutExpired:
+                self.ui_queue.put(("pl_inline_error", "yt-dlp playlist fetch timed out.", gen))
             except Exception as e:
-                self.ui_queue.put(("pl_inline_error", str(e)))
+                self.ui_queue.put(("pl_inline_error", str(e), gen))
 
-        threading.Thread(target=task, daemon=True).start()
+        self._pl_fetch_future = self.run_bg(task)
 
     def _pl_render_items(self, items):
         """Render fetched playlist items into the inline panel."""
@@ -2232,7 +2942,7 @@ class ClipsterApp:
             chk = ctk.CTkCheckBox(row, text="", variable=var, width=28)
             chk.pack(side="left", padx=(4, 6))
             lbl = ctk.CTkLabel(row, text=f"{i+1}. {entry['title']}", anchor="w",
-                               font=ctk.CTkFont(size=11))
+                               font=get_font(11))
             lbl.pack(side="left", fill="x", expand=True)
             self._pl_rows.append((var, entry))
 
@@ -2364,7 +3074,7 @@ class ClipsterApp:
                 lbl = ctk.CTkLabel(
                     self.dl_queue_scroll,
                     text="No videos added yet. Paste a URL above to get started.",
-                    text_color="#888888", font=ctk.CTkFont(size=12)
+                    text_color="#888888", font=get_font(12)
                 )
                 lbl.pack(pady=40)
                 self._dl_empty_label = lbl
@@ -2402,7 +3112,7 @@ class ClipsterApp:
         status_lbl = ctk.CTkLabel(
             row, text=badge_text, width=120, height=26,
             fg_color=badge_color, corner_radius=7,
-            font=ctk.CTkFont(size=11, weight="bold")
+            font=get_font(11, "bold")
         )
         status_lbl.grid(row=0, column=0, padx=(10, 8), pady=(10, 4), sticky="w")
         entry["_status_lbl"] = status_lbl
@@ -2413,7 +3123,7 @@ class ClipsterApp:
             title_text = "✖  " + truncate_text(sanitize_ytdlp_error(raw_err), 70)
         title_lbl = ctk.CTkLabel(
             row, text=title_text, anchor="w",
-            font=ctk.CTkFont(size=13, weight="bold")
+            font=get_font(13, "bold")
         )
         title_lbl.grid(row=0, column=1, sticky="w", padx=(0, 4), pady=(10, 4))
         entry["_title_lbl"] = title_lbl
@@ -2423,7 +3133,7 @@ class ClipsterApp:
         ctk.CTkButton(
             row, text="✕", width=28, height=28,
             fg_color="transparent", hover_color=DANGER_COLOR,
-            corner_radius=7, font=ctk.CTkFont(size=13),
+            corner_radius=7, font=get_font(13),
             command=make_remove()
         ).grid(row=0, column=2, padx=(0, 10), pady=(10, 4))
 
@@ -2439,7 +3149,7 @@ class ClipsterApp:
         if meta_str:
             ctk.CTkLabel(
                 meta_frame, text=meta_str, anchor="w",
-                font=ctk.CTkFont(size=11), text_color="#888888"
+                font=get_font(11), text_color="#888888"
             ).pack(side="left", padx=(0, 10))
 
         # Resolution combo — only for video formats, only when not done/error
@@ -2449,7 +3159,7 @@ class ClipsterApp:
                 meta_frame,
                 values=avail_res,
                 width=130, height=26, corner_radius=6,
-                font=ctk.CTkFont(size=11),
+                font=get_font(11),
                 state="normal" if status == "ready" else "disabled"
             )
             res_combo.set(entry.get("selected_res", "Best Available"))
@@ -2458,7 +3168,7 @@ class ClipsterApp:
             sz_text = format_filesize(entry.get("filesize_bytes")) if status == "ready" else ""
             size_lbl = ctk.CTkLabel(
                 meta_frame, text=sz_text,
-                font=ctk.CTkFont(size=11), text_color="#aaaaaa", width=80, anchor="w"
+                font=get_font(11), text_color="#aaaaaa", width=80, anchor="w"
             )
             size_lbl.pack(side="left")
             entry["_size_lbl"] = size_lbl
@@ -2477,7 +3187,7 @@ class ClipsterApp:
         elif is_audio and status == "ready":
             size_lbl = ctk.CTkLabel(
                 meta_frame, text=format_filesize(entry.get("filesize_bytes")),
-                font=ctk.CTkFont(size=11), text_color="#aaaaaa"
+                font=get_font(11), text_color="#aaaaaa"
             )
             size_lbl.pack(side="left")
             entry["_size_lbl"] = size_lbl
@@ -2498,7 +3208,7 @@ class ClipsterApp:
 
             speed_lbl = ctk.CTkLabel(
                 prog_frame, text=entry.get("_speed_text", ""),
-                font=ctk.CTkFont(size=10), text_color="#aaaaaa", width=100, anchor="e"
+                font=get_font(10), text_color="#aaaaaa", width=100, anchor="e"
             )
             speed_lbl.pack(side="left", expand=False)
             entry["_speed_lbl"] = speed_lbl
@@ -2516,7 +3226,7 @@ class ClipsterApp:
             ctk.CTkButton(
                 prog_frame, text="✕ Cancel", width=76, height=22,
                 fg_color="#3A1515", hover_color=DANGER_COLOR,
-                corner_radius=6, font=ctk.CTkFont(size=10, weight="bold"),
+                corner_radius=6, font=get_font(10, "bold"),
                 text_color="#F87171",
                 command=make_cancel_item()
             ).pack(side="right", padx=(6, 0))
@@ -2550,9 +3260,9 @@ class ClipsterApp:
                             lbl.configure(text=f"⏳ Fetching{dots}")
                     except Exception:
                         pass
-            self.root.after(500, tick)
+            self._schedule(500, tick)
 
-        self.root.after(500, tick)
+        self._schedule(500, tick)
 
     def _dl_remove_item(self, idx):
         """Remove item at idx from queue and re-render."""
@@ -2570,8 +3280,6 @@ class ClipsterApp:
         self._dl_update_summary()
 
     def _dl_start_all(self):
-        import shutil
-
         with self._dl_queue_lock:
             items = [(i, e) for i, e in enumerate(self._dl_queue)
                      if e.get("status") in ("ready", "error")]
@@ -2600,10 +3308,15 @@ class ClipsterApp:
 
         self.dl_download_btn.configure(state="disabled")
         total_count = len(items)
+        self.current_task_cancelled = False
+        self._task_cancel_event.clear()
 
         def dl_task():
             completed = 0
             for queue_idx, entry in items:
+                # Global cancel / shutdown stops the run; untouched items stay as they were
+                if self._task_cancel_event.is_set():
+                    break
                 # Reset cancel flag for this item before starting
                 cancel_flag = entry.get("_cancel_flag")
                 if cancel_flag:
@@ -2615,7 +3328,7 @@ class ClipsterApp:
                 self.ui_queue.put(("dl_item_status", queue_idx, "downloading", ""))
 
                 finished_event = threading.Event()
-                result = {"path": None, "error": None}
+                result = {"path": None, "error": None, "cancelled": False}
 
                 def progress_cb(percent, speed, eta, raw, _qidx=queue_idx, _entry=entry):
                     pval = (percent or 0.0) / 100.0
@@ -2636,21 +3349,28 @@ class ClipsterApp:
                     _r["error"] = sanitize_ytdlp_error(err)
                     _ev.set()
 
+                def cancelled_cb(_r=result, _ev=finished_event):
+                    # Covers global cancel and shutdown, which don't set the item's flag
+                    _r["cancelled"] = True
+                    _ev.set()
+
                 self.download_proc.start_download(
                     entry["url"], outdir, filename_template,
                     fmt_selector, cookies_path,
-                    progress_cb, finished_cb, error_cb
+                    progress_cb, finished_cb, error_cb,
+                    cancelled_callback=cancelled_cb
                 )
 
-                while not finished_event.is_set():
-                    # Check per-item cancel flag
-                    if cancel_flag and cancel_flag.is_set():
+                # Returns the moment the download finishes; the timeout only paces cancel checks
+                while not finished_event.wait(timeout=0.25):
+                    # Check per-item cancel flag and the global cancel
+                    if (cancel_flag and cancel_flag.is_set()) or self._task_cancel_event.is_set():
                         self.download_proc.cancel()
                         finished_event.wait(timeout=2)
                         break
-                    time.sleep(0.25)
 
-                cancelled = cancel_flag and cancel_flag.is_set()
+                cancelled = (result["cancelled"] or (cancel_flag and cancel_flag.is_set())
+                             or self._task_cancel_event.is_set())
 
                 if cancelled:
                     entry["_progress_pct"] = 0.0
@@ -2766,7 +3486,7 @@ class ClipsterApp:
         search_frame.pack(side="left", fill="x", expand=True, padx=(6, 8), pady=6)
         self.history_search_entry = ctk.CTkEntry(
             search_frame, placeholder_text="🔍  Search by title or uploader...",
-            height=38, corner_radius=10, font=ctk.CTkFont(size=13)
+            height=38, corner_radius=10, font=get_font(13)
         )
         self.history_search_entry.pack(fill="x", expand=True)
         self.history_search_entry.bind("<KeyRelease>", self._on_history_search)
@@ -2783,7 +3503,7 @@ class ClipsterApp:
             height=36,
             width=110,
             corner_radius=10,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
         ).pack(side="left", padx=(0, 6))
         ctk.CTkButton(
             btn_frame,
@@ -2794,39 +3514,105 @@ class ClipsterApp:
             height=36,
             width=110,
             corner_radius=10,
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=get_font(12, "bold"),
         ).pack(side="left")
 
         self.history_scroll = ctk.CTkScrollableFrame(frame, height=480, corner_radius=10)
         self.history_scroll.pack(fill="both", expand=True, padx=6, pady=6)
 
         if not self._history_loaded:
-            self.root.after(300, self.load_and_render_history)
+            self._schedule(300, self.load_and_render_history)
+
+    def _request_history_refresh(self):
+        """Coalesce refresh requests from queue events into one refresh at the next idle."""
+        if self._history_refresh_scheduled:
+            return
+        self._history_refresh_scheduled = True
+        self.root.after_idle(self._do_refresh_history)
 
-    def refresh_history(self):
-        """Refresh history list UI."""
+    def _do_refresh_history(self):
+        self._history_refresh_scheduled = False
+        self.refresh_history()
+
+    def refresh_history(self, reload=True):
+        """Refresh history list UI; reload=False re-renders the in-memory self.history."""
+        # A newer refresh abandons any unfinished batched render
+        self._history_render_gen = gen = getattr(self, "_history_render_gen", 0) + 1
         for widget in list(self.history_scroll.winfo_children()):
             try:
                 if widget.winfo_exists():
                     widget.destroy()
             except Exception:
                 pass
-        self.history = load_history()
+        if reload:
+            if self._history_write_q.unfinished_tasks:
+                # The file is about to change; the writer re-renders once it drains
+                self._history_reload_skipped = True
+            else:
+                self.history = load_history()
         search_term = self.history_search_entry.get().strip().lower() if hasattr(self, 'history_search_entry') else ""
         filtered_history = self.history
         if search_term:
-            filtered_history = [entry for entry in self.history if search_term in entry.get("title", "").lower() or search_term in entry.get("uploader", "").lower()]
+            keys = self._history_search_index()
+            filtered_history = [entry for entry, key in zip(self.history, keys) if search_term in key]
         if not filtered_history:
             lbl = ctk.CTkLabel(self.history_scroll, text="No history yet." if not search_term else "No matches found.", anchor="center")
             lbl.pack(pady=12)
             return
 
-        for idx, entry in enumerate(filtered_history):
-            row = self._create_history_row(idx, entry)
-            row.pack(fill="x", pady=6, padx=6)
+        # Build rows in small batches so the first screenful paints immediately and the
+        # rest fill in between events
+        def render_batch(start=0):
+            if gen != self._history_render_gen:
+                return
+            end = min(start + HISTORY_RENDER_BATCH, len(filtered_history))
+            for idx in range(start, end):
+                try:
+                    row = self._create_history_row(idx, filtered_history[idx])
+                    row.pack(fill="x", pady=6, padx=6)
+                except Exception as e:
+                    log_message(f"history row render error: {e}")
+            if end < len(filtered_history):
+                self._schedule(1, lambda: render_batch(end))
+
+        render_batch()
 
 
 
+    def _history_writer_loop(self):
+        """Apply queued history deletes/clears in order, off the Tk thread."""
+        while True:
+            job = self._history_write_q.get()
+            try:
+                if job is None:
+                    return
+                if job["op"] == "delete":
+                    delete_history_entry(job["index"], expected=job["entry"])
+                elif job["op"] == "clear":
+                    clear_history()
+            except Exception as e:
+                log_message(f"history writer error: {e}")
+            finally:
+                self._history_write_q.task_done()
+            if self._history_reload_skipped and not self._history_write_q.unfinished_tasks:
+                self._history_reload_skipped = False
+                self.safe_ui_call(self._request_history_refresh)
+
+    def _history_search_index(self):
+        """Lower-cased "title\nuploader" per entry of self.history, reused across keystrokes."""
+        # Keyed by id(); the stored entry reference keeps the id valid and is checked on reuse
+        prev = getattr(self, "_history_search_keys", {})
+        index = {}
+        keys = []
+        for entry in self.history:
+            hit = prev.get(id(entry))
+            if hit is None or hit[0] is not entry:
+                hit = (entry, f"{entry.get('title', '')}\n{entry.get('uploader', '')}".lower())
+            index[id(entry)] = hit
+            keys.append(hit[1])
+        self._history_search_keys = index
+        return keys
+
     def load_and_render_history(self):
         """Load history in a background thread after startup."""
         if self._history_loaded:
@@ -2856,10 +3642,10 @@ class ClipsterApp:
         else:
             info_text = f"{uploader} • {fmt} {res} • {date}"
         row_frame.grid_columnconfigure(0, weight=1)
-        title_lbl = ctk.CTkLabel(row_frame, text=title, anchor="w", font=ctk.CTkFont(size=13, weight="bold"))
+        title_lbl = ctk.CTkLabel(row_frame, text=title, anchor="w", font=get_font(13, "bold"))
         title_lbl.grid(row=0, column=0, sticky="w", padx=(12, 8), pady=(10, 0))
         info_lbl = ctk.CTkLabel(row_frame, text=info_text, anchor="w",
-                                font=ctk.CTkFont(size=11), text_color="#888888")
+                                font=get_font(11), text_color="#888888")
         info_lbl.grid(row=1, column=0, sticky="w", padx=(12, 8), pady=(0, 10))
 
         # Buttons
@@ -2871,7 +3657,7 @@ class ClipsterApp:
             btns, text="🌐  Open",
             width=78, height=32, corner_radius=8,
             fg_color=SUCCESS_COLOR, hover_color="#15803D",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=get_font(11, "bold"),
             command=lambda: self._history_open_in_browser(entry),
         )
         open_btn.pack(side="left", padx=(0, 5))
@@ -2881,7 +3667,7 @@ class ClipsterApp:
             btns, text="📋  Copy",
             width=80, height=32, corner_radius=8,
             fg_color="#7C3AED", hover_color="#6D28D9",
-            font=ctk.CTkFont(size=11, weight="bold"),
+            font=get_font(11, "bold"),
             command=lambda: self._history_copy_url(entry),
         )
         copy_btn.pack(side="left", padx=(0, 5))
@@ -2891,9 +3677,9 @@ class ClipsterApp:
             btns, text="✕",
             width=32, height=32, corner_radius=8,
             fg_color="#3F1515", hover_color=DANGER_COLOR,
-            font=ctk.CTkFont(size=14, weight="bold"),
+            font=get_font(14, "bold"),
             text_color="#F87171",
-            command=lambda: self._delete_history_entry(idx),
+            command=lambda: self._delete_history_entry(row_frame),
         )
         del_btn.pack(side="left")
 
@@ -2904,32 +3690,18 @@ class ClipsterApp:
 
     def _extract_video_id(self, url):
         """Extract video ID from YouTube URL."""
-        from urllib.parse import urlparse, parse_qs
-
-        try:
-            u = (url or "").strip()
-            parsed = urlparse(u)
-            if parsed.netloc and "youtu.be" in parsed.netloc:
-                return parsed.path.lstrip("/")
-            qs = parse_qs(parsed.query)
-            if "v" in qs and qs["v"]:
-                return qs["v"][0]
-            m = re.search(r"(?:v=|/vi?/|youtu\.be/|/embed/)([A-Za-z0-9_-]{11})", u)
-            if m:
-                return m.group(1)
-            return None
-        except Exception:
-            return None
+        return extract_video_id(url)
 
     def _on_history_search(self, event=None):
         """Handle search input change."""
-        self.refresh_history()
+        self.refresh_history(reload=False)
 
     def clear_history_prompt(self):
         """Prompt to clear history."""
         if messagebox.askyesno(APP_NAME, "Clear entire download history?"):
-            clear_history()
-            self.refresh_history()
+            self._history_write_q.put({"op": "clear"})
+            self.history = []
+            self.refresh_history(reload=False)
 
     def _history_open_in_browser(self, entry):
         """Open the video URL in the default web browser."""
@@ -2944,19 +3716,31 @@ class ClipsterApp:
             pyperclip.copy(url)
             _toast(self, "URL copied to clipboard")
 
-    def _delete_history_entry(self, idx):
-        """Delete a history entry."""
-        delete_history_entry(idx)
-        self.refresh_history()
+    def _delete_history_entry(self, row_frame):
+        """Delete a history entry and remove just its row (no full re-render)."""
+        entry = getattr(row_frame, "_entry", None)
+        # Row indices are positions in the (possibly filtered) view; locate the
+        # entry in the full history by identity so search results delete correctly
+        full_idx = next((i for i, e in enumerate(self.history) if e is entry), None)
+        if full_idx is None:
+            self.refresh_history()
+            return
+        self._history_write_q.put({"op": "delete", "index": full_idx, "entry": entry})
+        self.history.pop(full_idx)
+        try:
+            row_frame.destroy()
+        except Exception:
+            pass
+        if not self.history_scroll.winfo_children():
+            self.refresh_history(reload=False)
 
     def _build_update_tab(self, parent):
-        import webbrowser
         """Build the Update tab (checks GitHub for latest release)."""
         frame = ctk.CTkFrame(parent, corner_radius=12)
         frame.pack(fill="both", expand=True, padx=12, pady=12)
 
         # ── Clipster app update section ────────────────────────────────
-        ctk.CTkLabel(frame, text="Clipster App", font=ctk.CTkFont(size=18, weight="bold")).pack(pady=(16, 4))
+        ctk.CTkLabel(frame, text="Clipster App", font=get_font(18, "bold")).pack(pady=(16, 4))
 
         self.update_status_label = ctk.CTkLabel(frame, text="Checking for updates...", wraplength=480)
         self.update_status_label.pack(pady=6)
@@ -2972,7 +3756,7 @@ class ClipsterApp:
             height=38,
             width=140,
             corner_radius=10,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             command=self._check_update_button,
         )
         self.update_check_btn.pack(side="left", padx=6)
@@ -2985,7 +3769,7 @@ class ClipsterApp:
             height=38,
             width=190,
             corner_radius=10,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             command=self._download_and_install_update,
         )
         self.update_download_btn.pack(side="left", padx=6)
@@ -2998,7 +3782,7 @@ class ClipsterApp:
             height=38,
             width=160,
             corner_radius=10,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             command=lambda: webbrowser.open(GITHUB_RELEASES_URL),
         )
         self.update_open_btn.pack(side="left", padx=6)
@@ -3008,19 +3792,19 @@ class ClipsterApp:
 
         # ── yt-dlp updater section ─────────────────────────────────────
         ctk.CTkLabel(frame, text="yt-dlp Downloader Engine",
-                     font=ctk.CTkFont(size=15, weight="bold")).pack(pady=(16, 4))
+                     font=get_font(15, "bold")).pack(pady=(16, 4))
 
         ytdlp_desc = ctk.CTkLabel(
             frame,
             text="yt-dlp releases updates frequently to fix broken downloads. Click below to fetch and replace yt-dlp.exe in your Assets folder.",
             wraplength=500, justify="center", text_color="#AAAAAA",
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
         )
         ytdlp_desc.pack(pady=(0, 6))
 
         self.ytdlp_status_label = ctk.CTkLabel(
             frame, text="", wraplength=500,
-            font=ctk.CTkFont(size=12), text_color="#AAAAAA"
+            font=get_font(12), text_color="#AAAAAA"
         )
         self.ytdlp_status_label.pack(pady=(0, 4))
 
@@ -3043,7 +3827,7 @@ class ClipsterApp:
             height=38,
             width=180,
             corner_radius=10,
-            font=ctk.CTkFont(size=13, weight="bold"),
+            font=get_font(13, "bold"),
             command=self._update_ytdlp,
         )
         self.ytdlp_update_btn.pack(side="left", padx=6)
@@ -3056,38 +3840,33 @@ class ClipsterApp:
             height=38,
             width=155,
             corner_radius=10,
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             command=lambda: webbrowser.open("https://github.com/yt-dlp/yt-dlp/releases"),
         ).pack(side="left", padx=6)
 
         # Check for Clipster app updates on load
-        threading.Thread(target=self._check_for_updates, daemon=True).start()
-        # Show current yt-dlp version if exe exists
-        self.root.after(200, self._show_ytdlp_current_version)
+        self.run_bg(self._check_for_updates)
+        # Show current yt-dlp version if exe exists (spawns yt-dlp, so off the UI thread)
+        self.run_bg(self._show_ytdlp_current_version)
 
 
     def _show_ytdlp_current_version(self):
-        """Read the version string from the local yt-dlp.exe and show it."""
+        """Read the version string from the local yt-dlp.exe and show it. Runs in a background thread."""
         try:
-            lbl = getattr(self, "ytdlp_status_label", None)
-            if not lbl:
-                return
             if not YT_DLP_EXE.exists():
-                lbl.configure(text="yt-dlp.exe not found in Assets/", text_color=DANGER_COLOR)
-                return
-            result = run_subprocess_safe([str(YT_DLP_EXE), "--version"], timeout=8)
-            ver = (result.get("stdout") or "").strip()
-            if ver:
-                lbl.configure(text=f"Installed version: {ver}", text_color="#AAAAAA")
+                text, color = "yt-dlp.exe not found in Assets/", DANGER_COLOR
             else:
-                lbl.configure(text="Could not read yt-dlp version.", text_color="#AAAAAA")
+                result = run_subprocess_safe([str(YT_DLP_EXE), "--version"], timeout=8)
+                ver = (result.get("stdout") or "").strip()
+                text = f"Installed version: {ver}" if ver else "Could not read yt-dlp version."
+                color = "#AAAAAA"
+            # Tk is only touched on the UI thread, via the queue
+            self.ui_queue.put(("ytdlp_version", text, color))
         except Exception as e:
             log_message(f"_show_ytdlp_current_version error: {e}")
 
     def _update_ytdlp(self):
         """Download the latest yt-dlp.exe from GitHub and replace the one in Assets/."""
-        import requests
-
         btn = getattr(self, "ytdlp_update_btn", None)
         status_lbl = getattr(self, "ytdlp_status_label", None)
         progress_bar = getattr(self, "ytdlp_progress", None)
@@ -3115,7 +3894,7 @@ class ClipsterApp:
 
                 _set_status("Fetching latest release info...")
 
-                r = requests.get(YTDLP_API, timeout=10)
+                r = get_http_session().get(YTDLP_API, timeout=10)
                 r.raise_for_status()
                 data = r.json()
                 latest_tag = data.get("tag_name", "unknown")
@@ -3135,24 +3914,29 @@ class ClipsterApp:
                 _set_status(f"Downloading yt-dlp {latest_tag}...")
 
                 # Download to a temp file first, then replace
-                tmp_path = TEMP_DIR / "yt-dlp_new.exe"
-                with requests.get(exe_url, stream=True, timeout=60) as dl:
+                tmp_path = TEMP_DIR / f"yt-dlp_new_{uuid.uuid4().hex}.exe"
+                with get_http_session().get(exe_url, stream=True, timeout=60) as dl:
                     dl.raise_for_status()
                     total = int(dl.headers.get("Content-Length", 0))
                     downloaded = 0
+                    last_pct = None
                     with open(tmp_path, "wb") as f:
-                        for chunk in dl.iter_content(chunk_size=65536):
+                        for chunk in dl.iter_content(chunk_size=HTTP_DOWNLOAD_CHUNK):
                             if not chunk:
                                 continue
                             f.write(chunk)
                             downloaded += len(chunk)
                             if total and progress_bar:
-                                pct = downloaded / total
-                                self.root.after(0, lambda p=pct: progress_bar.set(p) if progress_bar else None)
+                                pct = downloaded * 100 // total
+                                if pct != last_pct:
+                                    last_pct = pct
+                                    self.root.after(0, lambda p=pct / 100: progress_bar.set(p) if progress_bar else None)
+                        f.flush()
+                        os.fsync(f.fileno())
 
-                # Atomic replace
-                import shutil
-                shutil.move(str(tmp_path), str(YT_DLP_EXE))
+                # Atomic replace — shutil.move falls back to copy+truncate on Windows
+                # when the target exists, which can leave a half-written yt-dlp.exe
+                os.replace(str(tmp_path), str(YT_DLP_EXE))
 
                 _set_status(f"✅ yt-dlp updated to {latest_tag}!", SUCCESS_COLOR)
                 log_message(f"yt-dlp updated to {latest_tag}")
@@ -3198,7 +3982,7 @@ class ClipsterApp:
             # Separator line above each section
             ctk.CTkFrame(frame, height=1, fg_color="#2D2D3A").pack(fill="x", padx=8, pady=(14, 0))
             lbl = ctk.CTkLabel(frame, text=text, anchor="w",
-                         font=ctk.CTkFont(size=13, weight="bold"),
+                         font=get_font(13, "bold"),
                          text_color=ACCENT_COLOR)
             lbl.pack(fill="x", padx=8, pady=(6, 2))
 
@@ -3218,7 +4002,7 @@ class ClipsterApp:
         self.settings_theme_combo.set(self.settings.get("theme", "dark"))
         self.settings_theme_combo.pack(side="left")
         ctk.CTkLabel(tf, text="(applies on Save)", text_color="#888888",
-                     font=ctk.CTkFont(size=11)).pack(side="left", padx=(8, 0))
+                     font=get_font(11)).pack(side="left", padx=(8, 0))
 
         # ── Downloads ───────────────────────────────────────────────
         section_label("⬇️  Downloads")
@@ -3231,8 +4015,10 @@ class ClipsterApp:
 
         pf = row_frame()
         ctk.CTkLabel(pf, text="Download folder:", anchor="w", width=160).pack(side="left", padx=(0, 8))
-        self.default_download_path_entry = ctk.CTkEntry(pf, width=360, height=36, corner_radius=8)
-        self.default_download_path_entry.insert(0, self.settings.get("default_download_path", str(DOWNLOADS_DIR)))
+        # Bound StringVar: resets and folder picks are a single .set() instead of delete+insert
+        self._dl_path_var = ctk.StringVar(value=self.settings.get("default_download_path", _DOWNLOADS_DIR_STR))
+        self.default_download_path_entry = ctk.CTkEntry(pf, width=360, height=36, corner_radius=8,
+                                                        textvariable=self._dl_path_var)
         self.default_download_path_entry.pack(side="left", fill="x", expand=True, padx=(0, 8))
         ctk.CTkButton(pf, text="Browse", height=36, corner_radius=8,
                       command=self.on_choose_download_folder).pack(side="left")
@@ -3299,14 +4085,17 @@ class ClipsterApp:
                       command=open_log_file).pack(side="left", padx=(0, 8))
         ctk.CTkButton(lf, text="🗑️  Clear Log", fg_color="#4B4B4B", hover_color="#5A5A5A",
                       height=36, corner_radius=10,
-                      command=self._on_clear_log).pack(side="left")
+                      command=self._on_clear_log).pack(side="left", padx=(0, 8))
+        ctk.CTkButton(lf, text="🧹  Clear Metadata Cache", fg_color="#4B4B4B", hover_color="#5A5A5A",
+                      height=36, corner_radius=10,
+                      command=self._on_clear_metadata_cache).pack(side="left")
 
         # ── Save / Reset ────────────────────────────────────────────
         ctk.CTkFrame(frame, height=1, fg_color="#2D2D3A").pack(fill="x", padx=8, pady=(18, 8))
         btn_frame = ctk.CTkFrame(frame, fg_color="transparent")
         btn_frame.pack(anchor="nw", padx=8, pady=(0, 16))
         ctk.CTkButton(btn_frame, text="💾  Save Settings", fg_color=ACCENT_COLOR, hover_color=ACCENT_HOVER,
-                      height=38, corner_radius=10, font=ctk.CTkFont(size=13, weight="bold"),
+                      height=38, corner_radius=10, font=get_font(13, "bold"),
                       command=self.on_apply_settings).pack(side="left", padx=(0, 8))
         ctk.CTkButton(btn_frame, text="↺  Reset to Defaults", fg_color="#4B4B4B", hover_color="#5A5A5A",
                       height=38, corner_radius=10,
@@ -3321,6 +4110,10 @@ class ClipsterApp:
             self.settings_cookies_entry.delete(0, "end")
             self.settings_cookies_entry.insert(0, path)
 
+    def _on_clear_metadata_cache(self):
+        clear_metadata_cache()
+        _toast(self, "Metadata cache cleared.", title="Cache")
+
     def _on_clear_log(self):
         try:
             if LOG_FILE.exists():
@@ -3335,7 +4128,7 @@ class ClipsterApp:
         """Apply and save settings. Theme is applied here (not live)."""
         self.settings["default_format"] = self.settings_format_combo.get()
         self.settings["theme"] = self.settings_theme_combo.get()
-        self.settings["default_download_path"] = self.default_download_path_entry.get() or str(DOWNLOADS_DIR)
+        self.settings["default_download_path"] = self.default_download_path_entry.get() or _DOWNLOADS_DIR_STR
         self.settings["cookies_path"] = self.settings_cookies_entry.get().strip()
         self.settings["use_smart_naming"] = bool(self.settings_smart_naming_switch.get())
         self.settings["show_toasts"] = bool(self.settings_toast_switch.get())
@@ -3357,8 +4150,7 @@ class ClipsterApp:
             self.settings = DEFAULT_SETTINGS.copy()
             self.settings_format_combo.set("mp4")
             self.settings_theme_combo.set("dark")
-            self.default_download_path_entry.delete(0, "end")
-            self.default_download_path_entry.insert(0, WINDOWS_DOWNLOADS_DIR)
+            self._dl_path_var.set(WINDOWS_DOWNLOADS_DIR)
             try:
                 self.settings_cookies_entry.delete(0, "end")
             except Exception:
@@ -3388,39 +4180,21 @@ class ClipsterApp:
         """Choose default download folder."""
         path = filedialog.askdirectory(initialdir=self.settings.get("default_download_path", WINDOWS_DOWNLOADS_DIR))
         if path:
-            self.default_download_path_entry.delete(0, "end")
-            self.default_download_path_entry.insert(0, path)
+            self._dl_path_var.set(path)
 
     def playlist_select_all(self):
         """Select all playlist items."""
-        for vid, row in list(self._playlist_row_by_vid.items()):
-            try:
-                if hasattr(row, "_selected_var"):
-                    row._selected_var.set(True)
-            except Exception:
-                pass
+        for v in self._playlist_selected_vars:
+            v.set(True)
 
     def playlist_deselect_all(self):
         """Deselect all playlist items."""
-        for vid, row in list(self._playlist_row_by_vid.items()):
-            try:
-                if hasattr(row, "_selected_var"):
-                    row._selected_var.set(False)
-            except Exception:
-                pass
+        for v in self._playlist_selected_vars:
+            v.set(False)
 
     def playlist_save_selection(self):
         """Save selected playlist URLs to text file."""
-        selected = []
-        for vid in list(self._playlist_row_order):
-            row = self._playlist_row_by_vid.get(vid)
-            if not row:
-                continue
-            sel = getattr(row, "_selected_var", None)
-            if sel and sel.get():
-                ent = getattr(row, "_entry", None)
-                if ent:
-                    selected.append(ent.get("url"))
+        selected = [u for v, u in zip(self._playlist_selected_vars, self._playlist_selected_urls) if u and v.get()]
         if not selected:
             messagebox.showinfo(APP_NAME, "No items selected to save.")
             return
@@ -3449,13 +4223,7 @@ class ClipsterApp:
         
         # ADD ROUNDED CORNERS HERE (before positioning)
         try:
-            import ctypes
-            hwnd = ctypes.windll.user32.GetParent(overlay.winfo_id())
-            DWMWA_WINDOW_CORNER_PREFERENCE = 33
-            DWMWCP_ROUND = 2
-            ctypes.windll.dwmapi.DwmSetWindowAttribute(
-                hwnd, DWMWA_WINDOW_CORNER_PREFERENCE, ctypes.byref(ctypes.c_int(DWMWCP_ROUND)), ctypes.sizeof(ctypes.c_int)
-            )
+            round_window_corners(overlay)
         except Exception:
             pass
         
@@ -3464,7 +4232,7 @@ class ClipsterApp:
         y = self.root.winfo_y() + (self.root.winfo_height() // 2) - 65  # Changed from 60 to 65
         overlay.geometry(f"+{x}+{y}")
         
-        lbl = ctk.CTkLabel(overlay, text=text, font=ctk.CTkFont(size=14))
+        lbl = ctk.CTkLabel(overlay, text=text, font=get_font(14))
         lbl.pack(pady=(24, 8))  # Changed padding for better spacing
         pb = ctk.CTkProgressBar(overlay, mode="indeterminate", height=8, corner_radius=4) 
         pb.pack(fill="x", padx=24, pady=(4, 24))  # Changed bottom padding
@@ -3481,8 +4249,35 @@ class ClipsterApp:
                 pass
             self.spinner_overlay = None
 
-    
-    
+    def _show_async_info(self, title, msg):
+        """Non-modal notice; repeated calls append to the open window instead of stacking."""
+        top = self._active_info_top
+        if top is not None:
+            try:
+                if top.winfo_exists():
+                    lbl = top._msg_lbl
+                    lbl.configure(text=lbl.cget("text") + "\n\n" + msg)
+                    top.lift()
+                    return
+            except Exception:
+                pass
+        top = ctk.CTkToplevel(self.root)
+        top.title(title)
+        top.resizable(False, False)
+        top.transient(self.root)
+        top._msg_lbl = ctk.CTkLabel(top, text=msg, wraplength=420, justify="left", anchor="w", font=get_font(12))
+        top._msg_lbl.pack(fill="both", expand=True, padx=18, pady=(16, 10))
+        ctk.CTkButton(top, text="OK", width=90, height=32, corner_radius=8,
+                      fg_color=ACCENT_COLOR, hover_color=ACCENT_HOVER,
+                      command=top.destroy).pack(pady=(0, 14))
+        top.bind("<Destroy>", lambda e, t=top: self._clear_active_info(t), add="+")
+        top.after(0, top.lift)
+        self._active_info_top = top
+
+    def _clear_active_info(self, top):
+        if self._active_info_top is top:
+            self._active_info_top = None
+
     def on_fetch_playlist(self):
         """Fetch playlist items incrementally."""
         url = self.playlist_url_entry.get().strip()
@@ -3492,39 +4287,56 @@ class ClipsterApp:
 
         self.show_spinner("Fetching playlist items...")
         self._playlist_row_by_vid.clear()
-        self._playlist_row_order.clear()
+        self._playlist_rows.clear()
+        self._playlist_selected_vars.clear()
+        self._playlist_selected_urls.clear()
         for w in self.playlist_scroll.winfo_children():
             w.destroy()
 
         def task():
             try:
+                cached = _cache_get(_playlist_cache, url, PLAYLIST_CACHE_TTL)
+                if cached is not None:
+                    numbered = [(i, dict(e)) for i, e in enumerate(cached, 1)]
+                    for k in range(0, len(numbered), PLAYLIST_ADD_BATCH):
+                        self.ui_queue.put(("playlist_items_add_batch", numbered[k:k + PLAYLIST_ADD_BATCH]))
+                    self.ui_queue.put(("playlist_fetch_done", len(cached)))
+                    return
                 cmd = [
                     windows_quote(str(YT_DLP_EXE)),
                     "--no-warnings", "--flat-playlist", "--dump-json", url
                 ]
-                result = run_subprocess_safe(cmd, timeout=60)
-                if result["timed_out"]:
-                    raise RuntimeError("yt-dlp playlist fetch timed out.")
-                if result["returncode"] != 0:
-                    raise RuntimeError(result["stderr"])
-                lines = [l for l in result["stdout"].splitlines() if l.strip()]
                 index = 0
                 seen_ids = set()
-                for line in lines:
-                    try:
-                        data = json.loads(line)
-                        title = data.get("title") or "<No title>"
-                        vid_id = data.get("id") or data.get("url")
-                        if not vid_id or vid_id in seen_ids:
-                            continue
-                        seen_ids.add(vid_id)
-                        full_url = f"https://youtube.com/watch?v={vid_id}"
-                        entry = {"title": title, "url": full_url, "id": vid_id}
-                        index += 1
-                        self.ui_queue.put(("playlist_item_add", index, entry))
-                    except Exception:
+                entries = []
+                batch = []
+                last_flush = time.monotonic()
+                # Rows go out in small batches: the first batch flushes right away so the
+                # list starts filling immediately, later ones every PLAYLIST_ADD_BATCH items
+                # or PLAYLIST_ADD_FLUSH_INTERVAL seconds
+                for data in iter_yt_dlp_json(cmd, timeout=60):
+                    title = data.get("title") or "<No title>"
+                    vid_id = data.get("id") or data.get("url")
+                    if not vid_id or vid_id in seen_ids:
                         continue
+                    seen_ids.add(vid_id)
+                    full_url = f"https://youtube.com/watch?v={vid_id}"
+                    entry = {"title": title, "url": full_url, "id": vid_id}
+                    index += 1
+                    entries.append(dict(entry))
+                    batch.append((index, entry))
+                    now = time.monotonic()
+                    if index == 1 or len(batch) >= PLAYLIST_ADD_BATCH or now - last_flush >= PLAYLIST_ADD_FLUSH_INTERVAL:
+                        self.ui_queue.put(("playlist_items_add_batch", batch))
+                        batch = []
+                        last_flush = now
+                if batch:
+                    self.ui_queue.put(("playlist_items_add_batch", batch))
+                _cache_put(_playlist_cache, url, entries)
                 self.ui_queue.put(("playlist_fetch_done", index))
+            except subprocess.TimeoutExpired:
+                log_message("Playlist fetch error: timed out")
+                self.ui_queue.put(("playlist_error", "yt-dlp playlist fetch timed out."))
             except Exception as e:
                 log_message(f"Playlist fetch error: {e}")
                 self.ui_queue.put(("playlist_error", str(e)))
@@ -3538,21 +4350,12 @@ class ClipsterApp:
 
 
     def on_download_playlist(self):
-        import shutil
         """Download selected playlist items in order."""
-        selected_entries = []
-        for vid in list(self._playlist_row_order):
-            row = self._playlist_row_by_vid.get(vid)
-            if not row:
-                continue
-            try:
-                sel = getattr(row, "_selected_var", None)
-                if sel and sel.get():
-                    entry = getattr(row, "_entry", None)
-                    if entry:
-                        selected_entries.append((vid, entry, row))
-            except Exception:
-                pass
+        selected_entries = [
+            (row._video_id, row._entry, row)
+            for row, sel in zip(self._playlist_rows, self._playlist_selected_vars)
+            if row._video_id and sel.get()
+        ]
 
         if not selected_entries:
             messagebox.showwarning(APP_NAME, "No playlist items selected for download. Use Select All or check items to download.")
@@ -3571,79 +4374,123 @@ class ClipsterApp:
         _toast(self, f"Downloading {len(selected_entries)} selected items...", title="Downloading", timeout=3000)
         self.playlist_overall_progress.set(0)
         self.current_task_cancelled = False
+        self._task_cancel_event.clear()
+        self._finalized_vids.clear()
 
         cookies_path = self.settings.get("cookies_path", "") or None
+        filename_template = (
+            "%(uploader)s - %(title)s.%(ext)s"
+            if self.settings.get("use_smart_naming", True)
+            else "%(title)s.%(ext)s"
+        )
 
-        def dl_seq_task():
-            total = len(selected_entries)
-            completed = 0
-            for vid, entry, row in selected_entries:
-                if self.current_task_cancelled:
-                    break
-                url = entry.get("url")
+        # Items overlap (download of one with the ffmpeg merge of another) up to the user's limit
+        try:
+            workers = max(1, int(self.settings.get("max_concurrent_downloads", 1)))
+        except (TypeError, ValueError):
+            workers = 1
+
+        # Fields shared by every history record of this run
+        history_base = {
+            "title": "", "url": "", "uploader": "", "duration": "",
+            "resolution": max_res,
+            "format": target_format,
+            "download_mode": "Playlist",
+            "download_path": outdir,
+            "date": "",
+        }
+
+        def download_one(vid, entry, row):
+            """Download one playlist item; returns its vid once recorded, None if skipped, failed or cancelled."""
+            if self._task_cancel_event.is_set():
+                return None
+            url = entry.get("url")
+            # The row's progress bar is created on the UI thread by the first progress event
+
+            finished_event = threading.Event()
+            out_path_holder = {"out": None}
+            error_holder = {"error": None}
+
+            def progress_callback(percent, speed, eta, raw_line):
+                pval = (percent or 0.0) / 100.0 if percent is not None else 0.0
+                self.ui_queue.put(("playlist_row_progress", vid, pval, speed, eta))
+            def finished_callback(output_path):
+                out_path_holder["out"] = output_path
+                finished_event.set()
+            def error_callback(err):
+                error_holder["error"] = str(err)
+                self.ui_queue.put(("playlist_row_error", vid, str(err)))
+                finished_event.set()
+
+            # Snapshot so a missing output path can be found by diff, not a full sort.
+            # Only meaningful when this is the sole writer to outdir.
+            pre_names = None
+            if workers == 1:
                 try:
-                    if not hasattr(row, "_progress"):
-                        row._progress = ctk.CTkProgressBar(row, width=160)
-                        row._progress.grid(row=0, column=3, padx=(8,10))
-                        row._progress.set(0)
+                    pre_names = list_file_names(outdir)
                 except Exception:
-                    pass
+                    pre_names = None
 
-                finished_event = threading.Event()
-                out_path_holder = {"out": None}
-
-                def progress_callback(percent, speed, eta, raw_line):
-                    pval = (percent or 0.0) / 100.0 if percent is not None else 0.0
-                    self.ui_queue.put(("playlist_row_progress", vid, pval, speed, eta))
-                def finished_callback(output_path):
-                    out_path_holder["out"] = output_path
-                    finished_event.set()
-                def error_callback(err):
-                    self.ui_queue.put(("playlist_row_error", vid, str(err)))
-                    finished_event.set()
-
-                filename_template = (
-                    "%(uploader)s - %(title)s.%(ext)s"
-                    if self.settings.get("use_smart_naming", True)
-                    else "%(title)s.%(ext)s"
-                )
+            info_stem = new_info_json_stem()
+            proc = DownloadProcess()
+            with self._playlist_procs_lock:
+                self._playlist_procs.add(proc)
+            try:
+                # A cancel only ends the wait; it is not reported as a per-item error
+                proc.start_download(url, outdir, filename_template, fmt_selector, cookies_path, progress_callback, finished_callback, error_callback, info_json_stem=info_stem, cancelled_callback=finished_event.set)
+                while not finished_event.wait(timeout=0.5):
+                    if self._task_cancel_event.is_set():
+                        proc.cancel()
+                        break
+            finally:
+                with self._playlist_procs_lock:
+                    self._playlist_procs.discard(proc)
 
-                self.download_proc.start_download(url, outdir, filename_template, fmt_selector, cookies_path, progress_callback, finished_callback, error_callback)
+            # Read (and delete) the metadata file on every exit path, not just success
+            meta = read_info_json_sidecar(info_stem)
 
-                while not finished_event.is_set():
-                    if self.current_task_cancelled:
-                        self.download_proc.cancel()
-                        break
-                    time.sleep(0.2)
+            # Failed and cancelled items get no history record and don't count as done
+            if error_holder["error"] is not None or self._task_cancel_event.is_set():
+                return None
 
-                outp = out_path_holder["out"]
-                if not outp:
-                    try:
-                        files = list(Path(outdir).glob("*"))
-                        files = [f for f in files if f.is_file()]
-                        if files:
-                            files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-                            outp = str(files[0])
-                    except Exception:
-                        outp = None
+            outp = out_path_holder["out"]
+            if not outp and pre_names is not None:
+                try:
+                    outp = newest_new_file(outdir, pre_names)
+                except Exception:
+                    outp = None
+            out_path = Path(outp) if outp else None
+            if not meta:
                 try:
                     meta = fetch_metadata_via_yt_dlp(url)
                 except Exception:
                     meta = {}
-                entry_hist = {
-                    "title": Path(outp).stem if outp else entry.get("title",""),
-                    "url": url,
-                    "uploader": meta.get("uploader") if meta else "",
-                    "duration": meta.get("duration_string") if meta else "",
-                    "resolution": max_res,
-                    "format": target_format,
-                    "download_mode": "Playlist",
-                    "download_path": outdir,
-                    "date": now_str()
-                }
-                append_history(entry_hist)
-                completed += 1
-                self.ui_queue.put(("playlist_seq_item_done", completed, total, vid))
+            entry_hist = dict(history_base)
+            entry_hist.update(
+                title=out_path.stem if out_path else entry.get("title",""),
+                url=url,
+                uploader=meta.get("uploader") if meta else "",
+                duration=meta.get("duration_string") if meta else "",
+                date=now_str(),
+            )
+            append_history(entry_hist)
+            return vid
+
+        def dl_seq_task():
+            total = len(selected_entries)
+            completed = 0
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(download_one, vid, entry, row) for vid, entry, row in selected_entries]
+                for fut in concurrent.futures.as_completed(futures):
+                    try:
+                        vid = fut.result()
+                    except Exception as e:
+                        log_message(f"Playlist item failed: {e}")
+                        continue
+                    if vid is None:
+                        continue
+                    completed += 1
+                    self.ui_queue.put(("playlist_seq_item_done", completed, total, vid))
             self.ui_queue.put(("playlist_seq_finished", completed, len(selected_entries)))
 
         threading.Thread(target=dl_seq_task, daemon=True).start()
@@ -3655,13 +4502,11 @@ class ClipsterApp:
             return
         url = entry.get("url")
         if url:
-            import webbrowser
             webbrowser.open(url)
         else:
             messagebox.showinfo(APP_NAME, "No URL available for this item.")
 
     def _playlist_row_open_youtube(self, row):
-        import webbrowser
         """Open video on YouTube."""
         entry = getattr(row, "_entry", None)
         if not entry:
@@ -3683,6 +4528,45 @@ class ClipsterApp:
         except Exception:
             messagebox.showinfo(APP_NAME, "Failed to copy to clipboard — please select and copy manually.")
 
+    def _playlist_add_row(self, idx, entry):
+        """Build one selectable row in the playlist tab."""
+        row = ctk.CTkFrame(self.playlist_scroll, height=80)
+        row.grid_columnconfigure(1, weight=1)
+        sel_var = ctk.BooleanVar(value=True)
+        chk = ctk.CTkCheckBox(row, text="", variable=sel_var)
+        chk.grid(row=0, column=0, padx=(8,6), pady=10)
+        title_lbl = ctk.CTkLabel(row, text=f"{idx}. {entry.get('title','<No title>')}", anchor="w", font=get_font(12))
+        title_lbl.grid(row=0, column=2, sticky="w", padx=(0, 8), pady=4)
+        row.pack(fill="x", padx=6, pady=4)
+        row._entry = entry
+        row._video_id = entry.get("id")
+        row._selected_var = sel_var
+        row._checkbox = chk
+        row._progress = None  # created on first progress event
+        row._progress_shown = False
+        self._playlist_rows.append(row)
+        self._playlist_selected_vars.append(sel_var)
+        self._playlist_selected_urls.append(entry.get("url"))
+
+        vid = entry.get("id")
+        if vid:
+            self._playlist_row_by_vid[vid] = row
+
+        def on_right_click(ev, r=row):
+            items = [
+                ("🌐 Open in Browser", lambda rr=r: self._playlist_row_play_preview(rr)),
+                ("🌐 Open on YouTube", lambda rr=r: self._playlist_row_open_youtube(rr)),
+                ("📋 Copy URL", lambda rr=r: self._playlist_row_copy_url(rr)),
+                ("❌ Remove from list", lambda rr=r: self._playlist_row_remove(rr))
+            ]
+            self._show_custom_menu(ev, items)
+
+        row.bind("<Button-3>", on_right_click)
+        for child in row.winfo_children():
+            child.bind("<Button-3>", on_right_click)
+        # However the row goes away, the lookup tables must not keep it alive
+        row.bind("<Destroy>", lambda e, r=row: self._forget_playlist_row(r), add="+")
+
     def _playlist_row_remove(self, row):
         """Remove row from playlist view."""
         vid = getattr(row, "_video_id", None)
@@ -3691,13 +4575,36 @@ class ClipsterApp:
                 row.destroy()
             except Exception:
                 pass
-            try:
-                del self._playlist_row_by_vid[vid]
-            except Exception:
-                pass
-            self._rebuild_playlist_order()
+            self._forget_playlist_row(row)
             _toast(self, "Removed item from playlist view.")
 
+    def _drop_playlist_row_progress(self, row):
+        """Hide a playlist row's progress bar; it is kept for reuse if the row downloads again."""
+        if row is None or not row._progress_shown:
+            return
+        row._progress_shown = False
+        try:
+            row._progress.set(0)
+            row._progress.grid_remove()
+        except TclError:
+            row._progress = None
+
+    def _forget_playlist_row(self, row):
+        """Drop every reference to a destroyed playlist row (idempotent)."""
+        vid = getattr(row, "_video_id", None)
+        if vid and self._playlist_row_by_vid.get(vid) is row:
+            del self._playlist_row_by_vid[vid]
+        self._rebuild_playlist_order(row)
+
+    def _rebuild_playlist_order(self, removed_row=None):
+        """Drop a removed row from the parallel per-row arrays."""
+        for i, r in enumerate(self._playlist_rows):
+            if r is removed_row:
+                del self._playlist_rows[i]
+                del self._playlist_selected_vars[i]
+                del self._playlist_selected_urls[i]
+                break
+
     
 
     def safe_ui_call(self, func, *args, **kwargs):
@@ -3723,7 +4630,12 @@ class ClipsterApp:
     def cancel_download(self):
         """Cancel current download."""
         self.current_task_cancelled = True
+        self._task_cancel_event.set()
         self.download_proc.cancel()
+        with self._playlist_procs_lock:
+            procs = list(self._playlist_procs)
+        for proc in procs:
+            proc.cancel()
         try:
             try: self.dl_download_btn.configure(state="normal")
             except Exception: pass
@@ -3731,285 +4643,372 @@ class ClipsterApp:
             pass
         _toast(self, "Download cancelled.", title="Cancelled", level="error")
 
-    def _process_ui_queue(self):
-        """Process UI update queue."""
+    def _wake_ui_queue(self):
+        """Called from any thread after ui_queue.put; posts one <<UIQueue>> per drain."""
+        if self._ui_wake_pending:
+            return
+        self._ui_wake_pending = True
+        try:
+            self.root.event_generate("<<UIQueue>>", when="tail")
+        except Exception:
+            # Window not ready or already gone — the fallback poll will pick it up
+            self._ui_wake_pending = False
+
+    def _drain_ui_queue(self):
+        """Handle everything queued so far, keeping only the newest progress per item."""
+        # Clear before draining so a put racing with us always triggers a fresh wake
+        self._ui_wake_pending = False
+        # Leftovers from a drain that hit the row budget go first to keep event order
+        items, self._ui_backlog = self._ui_backlog, []
         try:
             while True:
-                item = self.ui_queue.get_nowait()
-                try:
-                    self._handle_ui_event(item)
-                except Exception as e:
-                    log_message(f"UI event error: {e}")
+                items.append(self.ui_queue.get_nowait())
         except queue.Empty:
             pass
-        self.root.after(100, self._process_ui_queue)
-
-    def _handle_ui_event(self, item):
-        """Handle specific UI events from queue."""
-        ev = item[0]
-
-        if ev == "dl_item_progress":
-            # In-place update — no rebuild, just touch the widgets
-            queue_idx, pval, speed_text = item[1], item[2], item[3]
-            try:
-                with self._dl_queue_lock:
-                    entry = self._dl_queue[queue_idx] if 0 <= queue_idx < len(self._dl_queue) else None
-                if entry:
-                    pbar = entry.get("_progress_bar")
-                    if pbar:
-                        try:
-                            if pbar.winfo_exists():
-                                pbar.set(pval)
-                        except Exception:
-                            pass
-                    slbl = entry.get("_speed_lbl")
-                    if slbl:
-                        try:
-                            if slbl.winfo_exists():
-                                slbl.configure(text=speed_text)
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-            self._dl_update_summary()
-            return
-
-        if ev == "dl_overall_progress":
-            # Legacy event — summary handles overall bar now; ignore
+        if not items:
             return
-
-        if ev == "dl_all_finished":
-            completed, total = item[1], item[2]
+        # Progress events are absolute, so earlier ones for the same item are stale
+        last_progress = {}
+        for i, item in enumerate(items):
+            if item[0] in _COALESCED_UI_EVENTS:
+                last_progress[(item[0], item[1])] = i
+        rows_added = 0
+        handled = 0
+        for i, item in enumerate(items):
+            if item[0] in _COALESCED_UI_EVENTS and last_progress[(item[0], item[1])] != i:
+                continue
+            if rows_added >= UI_ROWS_PER_DRAIN or handled >= UI_MAX_EVENTS_PER_DRAIN:
+                # Let Tk paint before handling more; the rest runs on the next tick
+                self._ui_backlog = [it for j, it in enumerate(items[i:], i)
+                                    if it[0] not in _COALESCED_UI_EVENTS or last_progress[(it[0], it[1])] == j]
+                self._schedule(1, self._drain_ui_queue)
+                break
             try:
-                self.dl_download_btn.configure(state="normal")
-            except Exception:
-                pass
+                self._handle_ui_event(item)
+            except Exception as e:
+                log_message(f"UI event error: {e}")
+            handled += 1
+            if item[0] == "playlist_items_add_batch":
+                rows_added += len(item[1])
+        # Queue re-render and summary are recomputed once per drain, not per event
+        if self._dl_render_dirty:
+            self._dl_render_dirty = False
+            try:
+                self._dl_render_queue()
+            except Exception as e:
+                log_message(f"UI event error: {e}")
+        if self._dl_summary_dirty:
+            self._dl_summary_dirty = False
             self._dl_update_summary()
-            _toast(self, f"Download finished: {completed}/{total}", title="Download")
-            _outdir = self.settings.get("default_download_path", WINDOWS_DOWNLOADS_DIR)
-            windows_notify(
-                "Clipster",
-                f"Download finished: {completed}/{total} completed.",
-                open_path=_outdir
-            )
-            return
 
-        if ev == "dl_item_status":
-            idx, status, err = item[1], item[2], item[3]
-            with self._dl_queue_lock:
-                if 0 <= idx < len(self._dl_queue):
-                    self._dl_queue[idx]["status"] = status
-                    if status == "error":
-                        self._dl_queue[idx]["error"] = err
-            # Full rebuild needed: row layout changes (progress bar appears/disappears)
-            self._dl_render_queue()
-            self._dl_update_summary()
-            return
+    def _process_ui_queue(self):
+        """Slow fallback poll in case a <<UIQueue>> wake-up was dropped."""
+        self._drain_ui_queue()
+        self._schedule(UI_QUEUE_FALLBACK_MS, self._process_ui_queue)
 
-        if ev == "dl_meta_ready":
-            idx = item[1]
-            with self._dl_queue_lock:
-                if 0 <= idx < len(self._dl_queue):
-                    self._dl_queue[idx]["status"] = "ready"
-            self._dl_render_queue()
-            self._dl_update_summary()
-            return
+    def _handle_ui_event(self, item):
+        """Handle specific UI events from queue."""
+        handler = self._ui_handlers.get(item[0])
+        if handler is not None:
+            handler(item)
+
+    def _build_ui_handlers(self):
+        """Event name -> handler, built once; keeps _handle_ui_event an O(1) lookup."""
+        return {
+            "dl_item_progress": self._on_ui_dl_item_progress,
+            "titlebar_icon_ready": self._on_ui_titlebar_icon_ready,
+            "dl_overall_progress": self._on_ui_dl_overall_progress,
+            "dl_all_finished": self._on_ui_dl_all_finished,
+            "dl_item_status": self._on_ui_dl_item_status,
+            "dl_meta_ready": self._on_ui_dl_meta_ready,
+            "meta_fetched": self._on_ui_meta_fetched,
+            "meta_error": self._on_ui_meta_error,
+            "single_progress": self._on_ui_single_progress,
+            "single_finished": self._on_ui_single_finished,
+            "single_error_restricted": self._on_ui_single_error_restricted,
+            "single_error": self._on_ui_single_error,
+            "playlist_items_add_batch": self._on_ui_playlist_items_add_batch,
+            "playlist_fetch_done": self._on_ui_playlist_fetch_done,
+            "playlist_error": self._on_ui_playlist_error,
+            "pl_inline_items_ready": self._on_ui_pl_inline_items_ready,
+            "pl_inline_error": self._on_ui_pl_inline_error,
+            "playlist_row_progress": self._on_ui_playlist_row_progress,
+            "playlist_row_error": self._on_ui_playlist_row_error,
+            "playlist_seq_item_done": self._on_ui_playlist_seq_item_done,
+            "playlist_seq_finished": self._on_ui_playlist_seq_finished,
+            "update_status": self._on_ui_update_status,
+            "update_available": self._on_ui_update_available,
+            "update_install": self._on_ui_update_install,
+            "ytdlp_version": self._on_ui_ytdlp_version,
+        }
 
+    def _on_ui_dl_item_progress(self, item):
+        # In-place update — no rebuild, just touch the widgets
+        queue_idx, pval, speed_text = item[1], item[2], item[3]
+        with self._dl_queue_lock:
+            entry = self._dl_queue[queue_idx] if 0 <= queue_idx < len(self._dl_queue) else None
+        if entry:
+            # A row rebuilt mid-download leaves destroyed widgets behind; Tk reports that as TclError
+            pbar = entry.get("_progress_bar")
+            if pbar:
+                try:
+                    pbar.set(pval)
+                except TclError:
+                    pass
+            slbl = entry.get("_speed_lbl")
+            # Speed/ETA text often repeats between ticks; skip the Tk round-trip then
+            if slbl and getattr(slbl, "_last_text", None) != speed_text:
+                try:
+                    slbl.configure(text=speed_text)
+                    slbl._last_text = speed_text
+                except TclError:
+                    pass
+        self._dl_summary_dirty = True
 
-        if ev == "meta_fetched":
-            # Handled via dl_meta_ready in v1.3.0 queue system
-            return
+    def _on_ui_titlebar_icon_ready(self, item):
+        img = item[1]
+        try:
+            ctkimg = ctk.CTkImage(img, size=(22, 22))
+            self._titlebar_icon_lbl.configure(image=ctkimg, text="")
+            self._titlebar_icon_lbl.image = ctkimg
+        except Exception:
+            pass
 
-        if ev == "meta_error":
-            # Handled via dl_meta_error in v1.3.0 queue system
-            return
+    def _on_ui_dl_overall_progress(self, item):
+        # Legacy event — summary handles overall bar now; ignore
+        pass
 
-        if ev == "single_progress":
-            # progress routed through dl_overall_progress in v1.3.0
-            progress_value = item[1]
-            try: self.dl_overall_progress.set(progress_value)
-            except Exception: pass
-            return
+    def _on_ui_dl_all_finished(self, item):
+        completed, total = item[1], item[2]
+        try:
+            self.dl_download_btn.configure(state="normal")
+        except Exception:
+            pass
+        self._dl_summary_dirty = True
+        _toast(self, f"Download finished: {completed}/{total}", title="Download")
+        _outdir = self.settings.get("default_download_path", WINDOWS_DOWNLOADS_DIR)
+        windows_notify(
+            "Clipster",
+            f"Download finished: {completed}/{total} completed.",
+            open_path=_outdir
+        )
 
-        if ev == "single_finished":
-            # In v1.3.0 queue, dl_item_status "done" handles per-item completion
-            return
-        if ev == "single_error_restricted":
-            err = item[1]
-            messagebox.showerror(APP_NAME, "This video requires sign-in (age-restricted or members-only).\n\nTip: use yt-dlp with a cookies file.")
-            try: self.dl_download_btn.configure(state="normal")
-            except Exception: pass
-            return
+    def _on_ui_dl_item_status(self, item):
+        idx, status, err = item[1], item[2], item[3]
+        with self._dl_queue_lock:
+            if 0 <= idx < len(self._dl_queue):
+                self._dl_queue[idx]["status"] = status
+                if status == "error":
+                    self._dl_queue[idx]["error"] = err
+        # Full rebuild needed: row layout changes (progress bar appears/disappears)
+        self._dl_render_dirty = True
+        self._dl_summary_dirty = True
+
+    def _on_ui_dl_meta_ready(self, item):
+        idx = item[1]
+        with self._dl_queue_lock:
+            if 0 <= idx < len(self._dl_queue):
+                self._dl_queue[idx]["status"] = "ready"
+        self._dl_render_dirty = True
+        self._dl_summary_dirty = True
 
-        if ev == "single_error":
-            err = item[1]
-            messagebox.showerror(APP_NAME, f"Download failed: {err}")
-            try: self.dl_download_btn.configure(state="normal")
-            except Exception: pass
-            return
-        if ev == "playlist_item_add":
-            idx, entry = item[1], item[2]
-            row = ctk.CTkFrame(self.playlist_scroll, height=80)
-            row.grid_columnconfigure(1, weight=1)
-            sel_var = ctk.BooleanVar(value=True)
-            chk = ctk.CTkCheckBox(row, text="", variable=sel_var)
-            chk.grid(row=0, column=0, padx=(8,6), pady=10)
-            title_lbl = ctk.CTkLabel(row, text=f"{idx}. {entry.get('title','<No title>')}", anchor="w", font=ctk.CTkFont(size=12))
-            title_lbl.grid(row=0, column=2, sticky="w", padx=(0, 8), pady=4)
-            row.pack(fill="x", padx=6, pady=4)
-            row._entry = entry
-            row._video_id = entry.get("id")
-            row._selected_var = sel_var
-            row._checkbox = chk
-
-            vid = entry.get("id")
-            if vid:
-                self._playlist_row_by_vid[vid] = row
-                self._playlist_row_order.append(vid)
-
-            def on_right_click(ev, r=row):
-                items = [
-                    ("🌐 Open in Browser", lambda rr=r: self._playlist_row_play_preview(rr)),
-                    ("🌐 Open on YouTube", lambda rr=r: self._playlist_row_open_youtube(rr)),
-                    ("📋 Copy URL", lambda rr=r: self._playlist_row_copy_url(rr)),
-                    ("❌ Remove from list", lambda rr=r: self._playlist_row_remove(rr))
-                ]
-                self._show_custom_menu(ev, items)
+    def _on_ui_meta_fetched(self, item):
+        # Handled via dl_meta_ready in v1.3.0 queue system
+        pass
 
-            row.bind("<Button-3>", on_right_click)
-            for child in row.winfo_children():
-                child.bind("<Button-3>", on_right_click)
+    def _on_ui_meta_error(self, item):
+        # Handled via dl_meta_error in v1.3.0 queue system
+        pass
 
+    def _on_ui_single_progress(self, item):
+        # progress routed through dl_overall_progress in v1.3.0
+        progress_value = item[1]
+        try: self.dl_overall_progress.set(progress_value)
+        except Exception: pass
 
+    def _on_ui_single_finished(self, item):
+        # In v1.3.0 queue, dl_item_status "done" handles per-item completion
+        pass
 
-            try:
-                self.playlist_progress_label.configure(text=f"Loaded {idx} items...")
-            except Exception:
-                pass
+    def _on_ui_single_error_restricted(self, item):
+        err = item[1]
+        messagebox.showerror(APP_NAME, "This video requires sign-in (age-restricted or members-only).\n\nTip: use yt-dlp with a cookies file.")
+        try: self.dl_download_btn.configure(state="normal")
+        except Exception: pass
 
+    def _on_ui_single_error(self, item):
+        err = item[1]
+        messagebox.showerror(APP_NAME, f"Download failed: {err}")
+        try: self.dl_download_btn.configure(state="normal")
+        except Exception: pass
 
-            return
+    def _on_ui_playlist_items_add_batch(self, item):
+        batch = item[1]
+        for idx, entry in batch:
+            self._playlist_add_row(idx, entry)
+        try:
+            self.playlist_progress_label.configure(text=f"Loaded {batch[-1][0]} items...")
+        except Exception:
+            pass
 
-        if ev == "playlist_fetch_done":
-            total = item[1]
-            self.hide_spinner()
-            _toast(self, f"Fetched {total} playlist items.", title="Playlist", timeout=3000)
-            try:
-                self.playlist_progress_label.configure(text=f"Fetched {total} items.")
-            except Exception:
-                pass
-            return
+    def _on_ui_playlist_fetch_done(self, item):
+        total = item[1]
+        self.hide_spinner()
+        _toast(self, f"Fetched {total} playlist items.", title="Playlist", timeout=3000)
+        try:
+            self.playlist_progress_label.configure(text=f"Fetched {total} items.")
+        except Exception:
+            pass
 
-        if ev == "playlist_error":
-            err = item[1]
-            self.hide_spinner()
-            messagebox.showerror(APP_NAME, f"Playlist error: {err}")
-            _toast(self, "Ready")
-            return
+    def _on_ui_playlist_error(self, item):
+        err = item[1]
+        self.hide_spinner()
+        messagebox.showerror(APP_NAME, f"Playlist error: {err}")
+        _toast(self, "Ready")
 
-        if ev == "pl_inline_items_ready":
-            items = item[1]
-            try:
-                self._pl_render_items(items)
-            except Exception as e:
-                log_message(f"pl_inline_items_ready render error: {e}")
-            return
+    def _on_ui_pl_inline_items_ready(self, item):
+        items = item[1]
+        if item[2] != getattr(self, "_pl_fetch_gen", 0):
+            return  # superseded by a newer fetch
+        try:
+            self._pl_render_items(items)
+        except Exception as e:
+            log_message(f"pl_inline_items_ready render error: {e}")
 
-        if ev == "pl_inline_error":
-            err = item[1]
-            try:
-                self._pl_status_lbl.configure(text=f"❌ Error: {err}")
-            except Exception:
-                pass
-            _toast(self, f"Playlist fetch failed: {err}", level="error")
-            return
+    def _on_ui_pl_inline_error(self, item):
+        err = item[1]
+        if item[2] != getattr(self, "_pl_fetch_gen", 0):
+            return  # superseded by a newer fetch
+        try:
+            self._pl_status_lbl.configure(text=f"❌ Error: {err}")
+        except Exception:
+            pass
+        _toast(self, f"Playlist fetch failed: {err}", level="error")
 
-        if ev == "playlist_row_progress":
-            vid, pval, speed, eta = item[1], item[2], item[3], item[4]
-            row = self._playlist_row_by_vid.get(vid)
-            if row and hasattr(row, "_progress"):
-                try:
-                    if row._progress.winfo_exists():
-                        row._progress.set(pval)
-                except Exception:
-                    pass
+    def _on_ui_playlist_row_progress(self, item):
+        vid, pval, speed, eta = item[1], item[2], item[3], item[4]
+        row = self._playlist_row_by_vid.get(vid)
+        if row is None:
             return
+        # Queued events can outlive a closed row; don't let one abort the drain batch
+        try:
+            prog = row._progress
+            if prog is None:
+                prog = row._progress = ctk.CTkProgressBar(row, width=160)
+                prog.grid(row=0, column=3, padx=(8,10))
+                row._progress_shown = True
+            elif not row._progress_shown:
+                # Re-download of the same row: show the hidden bar again
+                prog.grid()
+                row._progress_shown = True
+            prog.set(pval)
+        except TclError:
+            pass
 
+    def _on_ui_playlist_row_error(self, item):
+        vid, err = item[1], item[2]
+        self._drop_playlist_row_progress(self._playlist_row_by_vid.get(vid))
+        # Non-modal: a modal dialog here would stall the queue drain for the other items
+        self._show_async_info(APP_NAME, f"Playlist item error: {err}")
 
-        if ev == "playlist_row_error":
-            vid, err = item[1], item[2]
-            row = self._playlist_row_by_vid.get(vid)
-            if row:
-                try:
-                    if hasattr(row, "_progress"):
-                        try:
-                            if row._progress.winfo_exists():
-                                row._progress.destroy()
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-            messagebox.showerror(APP_NAME, f"Playlist item error: {err}")
+    def _on_ui_playlist_seq_item_done(self, item):
+        completed, total, vid = item[1], item[2], item[3]
+        if vid in self._finalized_vids:
             return
-
-        if ev == "playlist_seq_item_done":
-            completed, total, vid = item[1], item[2], item[3]
-            overall = completed / total if total else 0.0
-            self.playlist_overall_progress.set(overall)
+        self._finalized_vids.add(vid)
+        self._drop_playlist_row_progress(self._playlist_row_by_vid.get(vid))
+        self._request_playlist_progress_ui(completed, total)
+        self._request_history_refresh()
+
+    def _request_playlist_progress_ui(self, completed, total, finished=False):
+        """Remember the latest playlist counts; one idle callback applies them."""
+        scheduled = self._pl_progress_pending is not None
+        self._pl_progress_pending = (completed, total, finished)
+        if not scheduled:
+            self.root.after_idle(self._apply_playlist_progress_ui)
+
+    def _apply_playlist_progress_ui(self):
+        completed, total, finished = self._pl_progress_pending
+        self._pl_progress_pending = None
+        value = 1.0 if finished else (completed / total if total else 0.0)
+        # Skip the canvas redraw when the bar already shows this value
+        if self.playlist_overall_progress.get() != value:
+            self.playlist_overall_progress.set(value)
+        if not finished:
             _toast(self, f"Playlist progress: {completed}/{total}", timeout=2200)
-            row = self._playlist_row_by_vid.get(vid)
-            if row:
-                try:
-                    if hasattr(row, "_progress"):
-                        row._progress.destroy()
-                except Exception:
-                    pass
-            self.refresh_history()
-            return
 
-        if ev == "playlist_seq_finished":
-            completed, total = item[1], item[2]
-            self.playlist_overall_progress.set(1.0)
-            _outdir = self.settings.get("default_download_path", WINDOWS_DOWNLOADS_DIR)
-            windows_notify(
-                "Clipster",
-                f"Playlist finished: {completed}/{total} downloads complete.",
-                open_path=_outdir
+    def _on_ui_playlist_seq_finished(self, item):
+        completed, total = item[1], item[2]
+        self._request_playlist_progress_ui(completed, total, finished=True)
+        _outdir = self.settings.get("default_download_path", WINDOWS_DOWNLOADS_DIR)
+        windows_notify(
+            "Clipster",
+            f"Playlist finished: {completed}/{total} downloads complete.",
+            open_path=_outdir
+        )
+        self._request_history_refresh()
+
+    def _on_ui_update_status(self, item):
+        try:
+            self.update_status_label.configure(text=item[1])
+        except Exception:
+            pass
+
+    def _on_ui_update_available(self, item):
+        latest, data = item[1], item[2]
+        self.latest_release_data = data
+        try:
+            self.update_status_label.configure(
+                text=f"🆕 New version available: {latest}\n(Current: {APP_VERSION})"
             )
-            self.refresh_history()
-            return
+        except Exception:
+            pass
+        if len(item) > 3 and item[3]:
+            _toast(self, f"{APP_NAME} {latest} is available — see the Update tab.", title="Update")
 
-        if ev == "update_status":
-            try:
-                self.update_status_label.configure(text=item[1])
-            except Exception:
-                pass
-            return
+    def _on_ui_update_install(self, item):
+        new_exe_path = item[1]
+        try: self.hide_spinner()
+        except Exception: pass
+        try:
+            self.update_status_label.configure(text="✅ Download complete. Installing update...")
+        except Exception:
+            pass
+        os.startfile(new_exe_path)
+        self._close_window()
 
-        if ev == "update_available":
-            latest, data = item[1], item[2]
-            self.latest_release_data = data
+    def _on_ui_ytdlp_version(self, item):
+        text, color = item[1], item[2]
+        lbl = getattr(self, "ytdlp_status_label", None)
+        if lbl:
             try:
-                self.update_status_label.configure(
-                    text=f"🆕 New version available: {latest}\n(Current: {APP_VERSION})"
-                )
-            except Exception:
+                lbl.configure(text=text, text_color=color)
+            except TclError:
                 pass
-            return
 
-        if ev == "update_install":
-            new_exe_path = item[1]
-            try: self.hide_spinner()
-            except Exception: pass
-            try:
-                self.update_status_label.configure(text="✅ Download complete. Installing update...")
-            except Exception:
-                pass
-            os.startfile(new_exe_path)
-            self._close_window()
-            return
+
+def _show_fatal_error(msg, root=None):
+    """Last-resort error window. Avoids messagebox, whose nested Tcl update can hang
+    when the failed root is half-initialised; the old root is torn down first."""
+    try:
+        if root is not None and root.winfo_exists():
+            root.destroy()
+    except Exception:
+        pass
+    try:
+        import tkinter as tk
+        win = tk.Tk()
+        win.title(APP_NAME)
+        win.resizable(False, False)
+        tk.Label(win, text=msg, justify="left", padx=18, pady=14).pack()
+        tk.Button(win, text="OK", width=10, command=win.destroy).pack(pady=(0, 12))
+        win.mainloop()
+    except Exception:
+        pass
+
 
 if __name__ == "__main__":
+    root = None
     try:
         ensure_directories()    
         root = ctk.CTk()
@@ -4021,13 +5020,9 @@ if __name__ == "__main__":
         root.mainloop()
 
     except Exception as e:
-        import traceback
         tb = traceback.format_exc()
         log_message(f"Unhandled exception in main: {e}\n{tb}")
-        try:
-            messagebox.showerror(APP_NAME, f"Fatal error during startup:\n{e}\n\nSee clipster.log for details.")
-        except Exception:
-            pass
+        _show_fatal_error(f"Fatal error during startup:\n{e}\n\nSee clipster.log for details.", root)
         print("Fatal error during startup — see clipster.log for details.")
         print(tb)
         sys.exit(1)
\ No newline at end of file